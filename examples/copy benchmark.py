@@ -0,0 +1,36 @@
+from pygame_work2 import *
+from pygame import Color
+from copy import deepcopy
+from timeit import timeit
+
+
+NUMBER = 20000
+
+
+def compare(name, old, new):
+    old_time = timeit(old, number=NUMBER) / NUMBER * 1000000
+    new_time = timeit(new, number=NUMBER) / NUMBER * 1000000
+    print("{:<24} deepcopy: {:>8.2f} us   snapshot: {:>8.2f} us   {:>6.1f}x".format(name, old_time, new_time,
+                                                                                   old_time / new_time))
+
+
+def main():
+    timer = CountDown.in_seconds(3, 60, print)
+    star = FilledPolygon(0, 0, Points.star(250, 100, 5), Format.middle, Format.middle, Color(255, 0, 0))
+    rect = FilledRect(0, 0, 100, 100, Format.default, Format.default, Color(0, 0, 255))
+    point = Point(rect.x, rect.y)
+
+    compare("Time arithmetic", lambda: deepcopy(timer), lambda: timer.copy())
+    compare("Rotate original", lambda: deepcopy(star.points), lambda: star.snapshot_points())
+    compare("Move original", lambda: deepcopy(point), lambda: point.snapshot())
+    compare("ColorTransition original", lambda: deepcopy(rect.color), lambda: Color(rect.color))
+
+    print()
+    for name, construct in (("Rotate", lambda: Rotate(star, 1, 60)),
+                            ("Move", lambda: Move(rect, Point(50, 50), 60)),
+                            ("ColorTransition", lambda: ColorTransition(rect, Color(255, 0, 0), 60))):
+        print("{:<24} construction: {:>8.2f} us".format(name, timeit(construct, number=NUMBER) / NUMBER * 1000000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+from pygame_work2 import *
+from pygame_work2.modules.pc_input.key import Key
+from timeit import timeit
+from tracemalloc import start, stop, take_snapshot
+
+
+COUNT = 100000
+NUMBER = 1000000
+
+
+class DictPoint:
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+
+class DictTimer:
+    def __init__(self, counter=0, factor=1):
+        self._counter = counter
+        self._factor = factor
+        self._active = False
+
+
+class DictKey:
+    def __init__(self, index, mod=0, unicode=""):
+        self._type = index
+        self._pressed = False
+        self._press_down = False
+        self._press_up = False
+        self._timer = DictTimer()
+        self._last_pressed_time = 0
+        self._mod = mod
+        self._unicode = unicode
+
+
+def memory(create):
+    """Measure the memory in bytes per instance created by a given function."""
+    start()
+    before = take_snapshot()
+    instances = list(create(i) for i in range(COUNT))
+    after = take_snapshot()
+    stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    del instances
+    return size / COUNT
+
+
+def compare(name, slotted, dictionary):
+    slotted_size = memory(slotted)
+    dictionary_size = memory(dictionary)
+    print("{:<8} __dict__: {:>7.1f} B   __slots__: {:>7.1f} B   {:>5.1f}x smaller".format(
+        name, dictionary_size, slotted_size, dictionary_size / slotted_size))
+
+
+def main():
+    compare("Point", lambda i: Point(i, i), lambda i: DictPoint(i, i))
+    compare("Timer", lambda i: Timer(i, 60), lambda i: DictTimer(i, 60))
+    compare("Key", lambda i: Key(i, 0, "a"), lambda i: DictKey(i, 0, "a"))
+
+    print()
+    slotted, dictionary = Point(1, 2), DictPoint(1, 2)
+    for name, point in (("__dict__", dictionary), ("__slots__", slotted)):
+        read = timeit(lambda: point.x + point.y, number=NUMBER) / NUMBER * 1000000000
+        write = timeit(lambda: setattr(point, "x", 3), number=NUMBER) / NUMBER * 1000000000
+        print("Point {:<9} read: {:>6.1f} ns   write: {:>6.1f} ns".format(name, read, write))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,4 +1,5 @@
 from .change import *
+from .ecs import *
 from .logic import *
 from .math import *
 from .particles import *
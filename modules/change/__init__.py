@@ -1,3 +1,7 @@
 from .effect import *
+from .batch import *
+from .composition import *
+from .clip import *
 from .animation import *
+from .scheduler import *
 from .timeline import *
@@ -0,0 +1,216 @@
+from ..logic.time import CountUp as _CountUp
+from ..math.calculus import LinearChange as _LinearChange
+from ..math.geometry import Box as _Box
+from .effect import Move as _Move, Resize as _Resize
+
+try:
+    import numpy as _np
+except ImportError:
+    _np = None
+
+
+class AbstractEffectBatch(_CountUp):
+    """A class to represent many effects of the same type and motion, updated together in one vectorized pass.
+
+    Every shape gets its own original value, result and delay (to stagger the effects), but all shapes share the same
+    motion class and ticks. The motion is sampled once per whole tick; when the motion is proportional to its
+    difference (LinearChange, ParabolaChange, TrigChange) one table is shared by all shapes, otherwise (such as
+    ExponentialChange) one table per shape is sampled. Each tick, all new values are computed with numpy and applied
+    to the shapes. The batch takes one slot on a TimeLine and always ends at the exact results, like fixed_end=True.
+    """
+
+    def __init__(self, shapes, originals, results, ticks, motion_class, delays, factor, func):
+        if _np is None:
+            raise ImportError("Error: effect batches require numpy")
+        self.shapes = list(shapes)
+        self.ticks = ticks
+        self.motion_class = motion_class
+        self.originals = _np.array(originals, dtype=float).reshape(len(self.shapes), 2)
+        self.results = _np.array(results, dtype=float).reshape(len(self.shapes), 2)
+        self.differences = self.results - self.originals
+        if delays is None:
+            delays = _np.zeros(len(self.shapes), dtype=int)
+        self.delays = _np.array(delays, dtype=int)
+        self._table = self._sample_motion()
+        maximum = ticks + (int(self.delays.max()) if len(self.shapes) > 0 else 0)
+        _CountUp.__init__(self, maximum, factor, func)
+
+    def _sample_motion(self):
+        """Sample the motion for every whole tick, as one shared table or as one table per shape and axis.
+
+        :return: table of shape (ticks + 1,) or (shapes, 2, ticks + 1)
+        :rtype: _np.ndarray
+        """
+        ticks = range(self.ticks + 1)
+        unit = _np.array(list(self.motion_class(1, self.ticks).s(t) for t in ticks))
+        double = _np.array(list(self.motion_class(2, self.ticks).s(t) for t in ticks))
+        if _np.allclose(double, 2 * unit):
+            return unit
+        return _np.array(list(list(list(self.motion_class(difference, self.ticks).s(t) for t in ticks)
+                                   for difference in differences) for differences in self.differences))
+
+    def changing(self, counter):
+        """Get the indices of the shapes that are moving at a given counter, not waiting for their delay or done.
+
+        :type counter: int
+        :rtype: _np.ndarray
+        """
+        return _np.nonzero((counter > self.delays) & (counter <= self.delays + self.ticks))[0]
+
+    def values(self, counter, indices):
+        """Calculate the values of shapes at a given counter.
+
+        :type counter: int
+        :param indices: indices of the shapes to calculate the values of
+        :type indices: _np.ndarray
+        :return: array of shape (indices, 2)
+        :rtype: _np.ndarray
+        """
+        local = counter - self.delays[indices]
+        if self._table.ndim == 1:
+            return self.originals[indices] + self.differences[indices] * self._table[local][:, None]
+        return self.originals[indices] + _np.stack((self._table[indices, 0, local], self._table[indices, 1, local]),
+                                                   axis=1)
+
+    def apply(self, values, indices):
+        """Apply calculated values to shapes.
+
+        Template to be inherited and filled in by every batch type.
+
+        :param values: array of shape (indices, 2)
+        :type values: _np.ndarray
+        :param indices: indices of the shapes to apply the values to
+        :type indices: _np.ndarray or range
+        """
+        pass
+
+    def tick(self):
+        """Increase counter if active, update all shapes and end at the exact results when done."""
+        if self._active:
+            self._counter += 1
+            if self._counter >= self._base:
+                self._active = False
+                self.apply(self.results, range(len(self.shapes)))
+                self._function.execute()
+            else:
+                indices = self.changing(self._counter)
+                self.apply(self.values(self._counter, indices), indices)
+
+    @staticmethod
+    def group(effects, factor=1):
+        """Group Move and Resize effects with the same type, motion class and ticks into batches.
+
+        :type effects: list of _Move or list of _Resize
+        :type factor: int
+        :rtype: list of AbstractEffectBatch
+        """
+        groups = dict()
+        for effect in effects:
+            key = (type(effect), effect.motion_class, effect.ticks)
+            groups.setdefault(key, list()).append(effect)
+
+        batches = list()
+        for (effect_type, motion_class, ticks), grouped in groups.items():
+            shapes = list(effect.shape for effect in grouped)
+            if issubclass(effect_type, _Move):
+                results = list((effect.result.x, effect.result.y) for effect in grouped)
+                batches.append(MoveBatch(shapes, results, ticks, motion_class, factor=factor))
+            elif issubclass(effect_type, _Resize):
+                results = list((effect.result[0], effect.result[1]) for effect in grouped)
+                batches.append(ResizeBatch(shapes, results, ticks, motion_class, factor=factor))
+        return batches
+
+
+class MoveBatch(AbstractEffectBatch):
+    """A class to represent many Move effects with the same motion, updated together in one vectorized pass."""
+
+    def __init__(self, shapes, new_positions, ticks, motion_class=_LinearChange, delays=None, factor=1, func=None):
+        """Initiate MoveBatch object, inheriting from AbstractEffectBatch class.
+
+        :param shapes: shapes to move
+        :type shapes: list of _Box
+        :param new_positions: x- and y-coordinate to move every shape to
+        :type new_positions: list of (float, float)
+        :param ticks: time it takes every shape to move
+        :type ticks: int
+        :param motion_class: class of the motion, such as LinearChange
+        :type motion_class: type
+        :param delays: ticks every shape waits before moving, to stagger the effects
+        :type delays: list of int or None
+        :type factor: int
+        :param func: object to store function and needed parameters, called when all shapes are done moving
+        :type func: _FunctionLoader or _Sequence or function or None
+        """
+        originals = list((shape.x, shape.y) for shape in shapes)
+        AbstractEffectBatch.__init__(self, shapes, originals, new_positions, ticks, motion_class, delays, factor, func)
+        # Shapes that don't override the position setters of Box only need x, y, x2 and y2 to be set, other shapes
+        # (Circle, Polygon, SurfaceRect...) keep derived values up to date in their setters.
+        self._direct = list(type(shape).set_x is _Box.set_x and type(shape).set_y is _Box.set_y for shape in shapes)
+
+    def apply(self, values, indices):
+        """Set the position of shapes, bypassing the setters where safe.
+
+        :type values: _np.ndarray
+        :type indices: _np.ndarray or range
+        """
+        for i, (x, y) in zip(list(indices), values.tolist()):
+            shape = self.shapes[i]
+            if self._direct[i]:
+                shape.x = x
+                shape.y = y
+                shape.x2 = x + shape.width
+                shape.y2 = y + shape.height
+            else:
+                shape.set_pos(x, y)
+
+    @staticmethod
+    def stagger(shapes, new_positions, ticks, delay, motion_class=_LinearChange, factor=1, func=None):
+        """Create MoveBatch in which every next shape starts moving a given amount of ticks later.
+
+        :type shapes: list of _Box
+        :type new_positions: list of (float, float)
+        :type ticks: int
+        :param delay: ticks between the start of two consecutive shapes
+        :type delay: int
+        :type motion_class: type
+        :type factor: int
+        :type func: _FunctionLoader or _Sequence or function or None
+        :rtype: MoveBatch
+        """
+        delays = list(i * delay for i in range(len(shapes)))
+        return MoveBatch(shapes, new_positions, ticks, motion_class, delays, factor, func)
+
+
+class ResizeBatch(AbstractEffectBatch):
+    """A class to represent many Resize effects with the same motion, updated together in one vectorized pass."""
+
+    def __init__(self, shapes, new_sizes, ticks, motion_class=_LinearChange, delays=None, factor=1, func=None):
+        """Initiate ResizeBatch object, inheriting from AbstractEffectBatch class.
+
+        :param shapes: shapes to resize
+        :type shapes: list of _Box
+        :param new_sizes: width and height to resize every shape to
+        :type new_sizes: list of (float, float)
+        :param ticks: time it takes every shape to resize
+        :type ticks: int
+        :param motion_class: class of the motion, such as LinearChange
+        :type motion_class: type
+        :param delays: ticks every shape waits before resizing, to stagger the effects
+        :type delays: list of int or None
+        :type factor: int
+        :param func: object to store function and needed parameters, called when all shapes are done resizing
+        :type func: _FunctionLoader or _Sequence or function or None
+        """
+        originals = list((shape.width, shape.height) for shape in shapes)
+        AbstractEffectBatch.__init__(self, shapes, originals, new_sizes, ticks, motion_class, delays, factor, func)
+
+    def apply(self, values, indices):
+        """Set the size of shapes.
+
+        Sizes are always set through set_size, because alignment modes and surfaces depend on it.
+
+        :type values: _np.ndarray
+        :type indices: _np.ndarray or range
+        """
+        for i, (width, height) in zip(list(indices), values.tolist()):
+            self.shapes[i].set_size(width, height)
@@ -0,0 +1,150 @@
+from array import array as _array
+from pygame import Color as _Color
+
+from ..logic.common import clamp as _clamp
+from .effect import AbstractEffect as _AbstractEffect
+
+_CHANNELS = ("x", "y", "width", "height", "r", "g", "b", "angle")
+
+
+class BakedClip:
+    """A class to represent an effect or composition sampled once into a compact array of keyframes.
+
+    Every keyframe holds the change of the shape since the start of the clip for the channels the effect uses (a subset
+    of x, y, width, height, r, g, b and angle), for every tick from 0 up to and including the last tick. Because the
+    changes are relative, one clip can be played on any amount of shapes at the same time. Clips baked from effects
+    that change shapes in the same way are shared through a cache.
+    """
+
+    max_cached = 256
+    _cache = dict()
+
+    def __init__(self, channels, frames):
+        """Initiate BakedClip object.
+
+        :param channels: names of the channels in every keyframe, in the order of _CHANNELS
+        :type channels: tuple of str
+        :param frames: all keyframes after each other
+        :type frames: _array
+        """
+        self.channels = tuple(channels)
+        self.frames = frames
+
+    def get(self, index):
+        """Get the keyframe at a given index, clamped to the first and last keyframe.
+
+        :type index: int
+        :return: value of every channel
+        :rtype: tuple of float
+        """
+        width = len(self.channels)
+        index = min(max(index, 0), len(self) - 1) * width
+        return tuple(self.frames[index:index + width])
+
+    def __len__(self):
+        """Return the amount of keyframes, the amount of ticks of the clip plus 1."""
+        if len(self.channels) == 0:
+            return 1
+        return len(self.frames) // len(self.channels)
+
+    def __repr__(self):
+        """Return repr(self)."""
+        return "<BakedClip channels: {}, keyframes: {}>".format(" ".join(self.channels), len(self))
+
+    @staticmethod
+    def bake(effect):
+        """Sample the keyframes of an effect or composition, which has not been started yet.
+
+        :param effect: effect or composition to bake, its shape is not changed
+        :type effect: _AbstractEffect or AbstractComposition
+        :rtype: BakedClip
+        """
+        keyframes = effect.keyframes(dict())
+        used = set(channel for keyframe in keyframes for channel in keyframe)
+        channels = tuple(channel for channel in _CHANNELS if channel in used)
+        frames = _array("d", (keyframe.get(channel, 0) for keyframe in keyframes for channel in channels))
+        return BakedClip(channels, frames)
+
+    @staticmethod
+    def from_effect(effect):
+        """Get the baked clip of an effect or composition from the cache, bake and cache it when it is not cached.
+
+        :type effect: _AbstractEffect or AbstractComposition
+        :rtype: BakedClip
+        """
+        key = effect.bake_key()
+        if key is None:
+            return BakedClip.bake(effect)
+        clip = BakedClip._cache.get(key)
+        if clip is None:
+            clip = BakedClip.bake(effect)
+            if len(BakedClip._cache) >= BakedClip.max_cached:
+                del BakedClip._cache[next(iter(BakedClip._cache))]
+            BakedClip._cache[key] = clip
+        return clip
+
+    @staticmethod
+    def clear_cache():
+        """Remove all shared clips."""
+        BakedClip._cache.clear()
+
+
+class PlayClip(_AbstractEffect):
+    """A class to represent an effect that replays a baked clip on a shape by index, without evaluating any curves."""
+
+    def __init__(self, shape, clip, factor=1):
+        """Initiate PlayClip object, inheriting from AbstractEffect class.
+
+        :param shape: shape to play the clip on
+        :type shape: _Rect
+        :type clip: BakedClip
+        :type factor: int
+        """
+        _AbstractEffect.__init__(self, shape, None, clip, len(clip) - 1, factor, True)
+        self.capture()
+
+    def capture(self):
+        color = getattr(self.shape, "color", None)
+        points = self.shape.snapshot_points() if "angle" in self.result.channels else None
+        self.original = (self.shape.x, self.shape.y, self.shape.width, self.shape.height,
+                         None if color is None else _Color(color), points)
+
+    def apply(self, index):
+        """Set the shape to the original plus the keyframe at a given index.
+
+        :type index: int
+        """
+        changes = dict(zip(self.result.channels, self.result.get(index)))
+        x, y, width, height, color, points = self.original
+        if points is not None:
+            self.shape.set_points(points)
+            self.shape.rotate(changes["angle"])
+        if "width" in changes or "height" in changes:
+            self.shape.set_size(width + changes.get("width", 0), height + changes.get("height", 0))
+        if "x" in changes or "y" in changes:
+            self.shape.set_pos(x + changes.get("x", 0), y + changes.get("y", 0))
+        if color is not None and ("r" in changes or "g" in changes or "b" in changes):
+            self.shape.color.r = int(_clamp(color.r + changes.get("r", 0), 0, 255))
+            self.shape.color.g = int(_clamp(color.g + changes.get("g", 0), 0, 255))
+            self.shape.color.b = int(_clamp(color.b + changes.get("b", 0), 0, 255))
+
+    def keyframes(self, start):
+        # Clips are relative to the shape at the start, so they don't depend on previous changes.
+        return list(dict(zip(self.result.channels, self.result.get(i))) for i in range(len(self.result)))
+
+    def shape_update(self):
+        self.apply(int(self._counter))
+
+    def fixed_end_func(self):
+        self.apply(len(self.result) - 1)
+
+    @staticmethod
+    def from_effect(shape, effect, factor=1):
+        """Create PlayClip of the baked clip of an effect or composition, shared with all equal effects.
+
+        :type shape: _Rect
+        :type effect: _AbstractEffect or AbstractComposition
+        :type factor: int
+        :rtype: PlayClip
+        """
+        return PlayClip(shape, BakedClip.from_effect(effect), factor)
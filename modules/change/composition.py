@@ -0,0 +1,149 @@
+from ..logic.time import CountUp as _CountUp
+
+
+class AbstractComposition(_CountUp):
+    """A class to represent a collection of effects and timers that run at precomputed offsets from one clock.
+
+    Every event starts once the composition has counted up to its offset, and is then ticked by the composition
+    until it is done. The composition takes one slot on a TimeLine, no matter how many events it contains, and ends
+    when its last event ends. Effects take their original from the shape when they start (see AbstractEffect.capture),
+    so a Move that follows another Move starts where the first one ended. Compositions can contain other compositions.
+    """
+
+    def __init__(self, events, offsets, factor, func):
+        """Initiate AbstractComposition object, inheriting from CountUp class.
+
+        :param events: effects, timers or compositions to run, which must not be on a TimeLine themselves
+        :type events: list of _CountUp
+        :param offsets: ticks after the start of the composition that every event starts
+        :type offsets: list of int
+        :type factor: int
+        :param func: object to store function and needed parameters, called when all events are done
+        :type func: _FunctionLoader or _Sequence or function or None
+        """
+        self.events = list(events)
+        self.offsets = list(offsets)
+        self._order = sorted(range(len(self.events)), key=self.offsets.__getitem__)
+        self._next = 0
+        self._running = list()
+        self.durations = list(event.remaining() for event in self.events)
+        self.ticks = max((offset + duration for offset, duration in zip(self.offsets, self.durations)), default=0)
+        _CountUp.__init__(self, self.ticks, factor, func)
+
+    def capture(self):
+        """Nothing to capture, every event captures its own original when it starts."""
+        pass
+
+    def keyframes(self, start):
+        """Get the summed change per channel of all effects after every tick, used to bake compositions.
+
+        All effects are expected to change the same shape. Every effect is sampled from the change the shape has at
+        its offset, like capture does when the composition runs.
+
+        :param start: change per channel the shape already has when the composition starts
+        :type start: dict
+        :rtype: list of dict
+        """
+        frames = list(dict() for _ in range(self.ticks + 1))
+        for i in self._order:
+            event, offset, duration = self.events[i], self.offsets[i], self.durations[i]
+            if not hasattr(event, "keyframes"):
+                continue
+            changes = frames[offset]
+            event_start = dict((channel, start.get(channel, 0) + changes.get(channel, 0))
+                               for channel in set(start) | set(changes))
+            event_frames = event.keyframes(event_start)
+            for counter in range(offset, self.ticks + 1):
+                for channel, value in event_frames[min(counter - offset, duration)].items():
+                    frames[counter][channel] = frames[counter].get(channel, 0) + value
+        return frames
+
+    def bake_key(self):
+        """Get a key that is equal for compositions that change any shape in the same way, or None.
+
+        :rtype: tuple or None
+        """
+        keys = list()
+        for event, duration in zip(self.events, self.durations):
+            key = event.bake_key() if hasattr(event, "bake_key") else ("wait", duration)
+            if key is None:
+                return None
+            keys.append(key)
+        return type(self), tuple(self.offsets), tuple(keys)
+
+    def reset(self, active=False):
+        """Reset composition and all its events, so it runs from the start again."""
+        _CountUp.reset(self, active)
+        self._next = 0
+        self._running = list()
+        for event in self.events:
+            event.reset()
+
+    def tick(self):
+        """Increase counter if active, start the events whose offset is reached and tick all running events."""
+        if self._active:
+            self._counter += 1
+            while self._next < len(self._order) and self.offsets[self._order[self._next]] < self._counter:
+                event = self.events[self._order[self._next]]
+                self._next += 1
+                if hasattr(event, "capture"):
+                    event.capture()
+                event.start()
+                self._running.append(event)
+
+            for event in self._running:
+                event.tick()
+            self._running = list(event for event in self._running if event.get_active())
+
+            if self._counter >= self._base:
+                self._active = False
+                self._function.execute()
+
+
+class Sequential(AbstractComposition):
+    """A class to represent effects and timers that run one after another."""
+
+    def __init__(self, *events, factor=1, func=None):
+        """Initiate Sequential object, inheriting from AbstractComposition class.
+
+        :type events: _CountUp
+        :type factor: int
+        :param func: object to store function and needed parameters, called when the last event is done
+        :type func: _FunctionLoader or _Sequence or function or None
+        """
+        offsets = list()
+        offset = 0
+        for event in events:
+            offsets.append(offset)
+            offset += event.remaining()
+        AbstractComposition.__init__(self, events, offsets, factor, func)
+
+
+class Parallel(AbstractComposition):
+    """A class to represent effects and timers that all start at the same time."""
+
+    def __init__(self, *events, factor=1, func=None):
+        """Initiate Parallel object, inheriting from AbstractComposition class.
+
+        :type events: _CountUp
+        :type factor: int
+        :param func: object to store function and needed parameters, called when the longest event is done
+        :type func: _FunctionLoader or _Sequence or function or None
+        """
+        AbstractComposition.__init__(self, events, list(0 for _ in events), factor, func)
+
+
+class Stagger(AbstractComposition):
+    """A class to represent effects and timers in which every next event starts a given amount of ticks later."""
+
+    def __init__(self, events, delay, factor=1, func=None):
+        """Initiate Stagger object, inheriting from AbstractComposition class.
+
+        :type events: list of _CountUp
+        :param delay: ticks between the start of two consecutive events
+        :type delay: int
+        :type factor: int
+        :param func: object to store function and needed parameters, called when the last event is done
+        :type func: _FunctionLoader or _Sequence or function or None
+        """
+        AbstractComposition.__init__(self, events, list(i * delay for i in range(len(events))), factor, func)
@@ -1,16 +1,19 @@
 from ..logic.common import clamp as _clamp
 from ..logic.time import CountUp as _CountUp
+from ..logic.constants import Default as _Default
 from ..math.calculus import LinearChange as _LinearChange
 from ..math.geometry import Point as _Point
-from copy import deepcopy as _deepcopy
+from pygame import Color as _Color
 
 
 class AbstractEffect(_CountUp):
     def __init__(self, shape, original, result, ticks, factor, fixed_end):
+        # original and result are snapshots taken by the effect types, so they can't change along with the shape.
         self.shape = shape
-        self.original = _deepcopy(original)
-        self.result = _deepcopy(result)
+        self.original = original
+        self.result = result
         self.fixed_end = fixed_end
+        self.ticks = ticks
         if self.fixed_end:
             func = self.fixed_end_func
         else:
@@ -18,10 +21,82 @@ class AbstractEffect(_CountUp):
         _CountUp.__init__(self, ticks, factor, func)
         self._counter = 1
         self._base += 1
+        self._previous = None
+
+    def _step(self, motion):
+        # Change of motion since the previous update: one tick of speed when ticking, or the exact difference in
+        # distance when advancing by elapsed time.
+        if self._previous is None:
+            return motion.v(self._counter)
+        return motion.s(self._counter) - motion.s(self._previous)
+
+    def capture(self):
+        """Take the original from the current state of the shape, such as when the effect starts after another effect.
+
+        This function is meant as a template for all subclasses to inherit and fill in.
+        """
+        pass
+
+    def differences(self):
+        """Get the difference between result and original per channel (x, y, width, height, r, g, b, angle).
+
+        This function is meant as a template for all subclasses to inherit and fill in, it is used to bake effects.
+
+        :rtype: dict or None
+        """
+        return None
+
+    def keyframes(self, start):
+        """Get the change of the shape per channel after every tick, from 0 up to and including ticks.
+
+        :param start: change per channel the shape already has when the effect starts, such as in a Sequential
+        :type start: dict
+        :rtype: list of dict
+        """
+        frames = list(dict() for _ in range(self.ticks + 1))
+        for channel, difference in (self.differences() or dict()).items():
+            difference -= start.get(channel, 0)
+            motion = self.motion_class(difference, self.ticks)
+            for counter in range(self.ticks):
+                frames[counter][channel] = motion.s(counter)
+            frames[self.ticks][channel] = difference
+        return frames
+
+    def bake_key(self):
+        """Get a key that is equal for effects that change any shape in the same way, or None if it can't be shared.
+
+        :rtype: tuple or None
+        """
+        differences = self.differences()
+        if differences is None:
+            return None
+        return type(self), self.motion_class, self.ticks, tuple(sorted(differences.items()))
 
     def shape_update(self):
         pass
 
+    def reset(self, active=False):
+        # Effects count from 1, their counter is the amount of ticks done after the coming tick.
+        _CountUp.reset(self, active)
+        self._counter = 1
+        self._previous = None
+
+    def advance(self, seconds):
+        """Advance effect by elapsed seconds instead of by one tick, evaluating its motion at fractional ticks."""
+        if not self._active:
+            return
+        if self._previous is None:
+            self._counter -= 1
+        self._previous = self._counter
+        self._counter = min(self._counter + seconds * _Default.ticks, self._base - 1)
+        if self._counter < self._base - 1:
+            self.shape_update()
+            return
+        if not self.fixed_end:
+            self.shape_update()
+        self._active = False
+        self._function.execute()
+
     def fixed_end_func(self):
         pass
 
@@ -32,9 +107,15 @@ class AbstractEffect(_CountUp):
 
 class Move(AbstractEffect):
     def __init__(self, shape, new_pos, ticks, motion_class=_LinearChange, factor=1, fixed_end=True):
-        AbstractEffect.__init__(self, shape, _Point(shape.x, shape.y), new_pos, ticks, factor, fixed_end)
-        self.motion_x = motion_class(self.result.x - self.shape.x, ticks)
-        self.motion_y = motion_class(self.result.y - self.shape.y, ticks)
+        AbstractEffect.__init__(self, shape, _Point(shape.x, shape.y), _Point(new_pos[0], new_pos[1]), ticks, factor,
+                                fixed_end)
+        self.motion_class = motion_class
+        self.capture()
+
+    def capture(self):
+        self.original = _Point(self.shape.x, self.shape.y)
+        self.motion_x = self.motion_class(self.result.x - self.original.x, self.ticks)
+        self.motion_y = self.motion_class(self.result.y - self.original.y, self.ticks)
 
     def shape_update(self):
         if self.fixed_end:
@@ -42,10 +123,13 @@ class Move(AbstractEffect):
             y = self.original.y + self.motion_y.s(self._counter)
             self.shape.set_pos(x, y)
         else:
-            dx = self.motion_x.v(self._counter)
-            dy = self.motion_y.v(self._counter)
+            dx = self._step(self.motion_x)
+            dy = self._step(self.motion_y)
             self.shape.move(dx, dy)
 
+    def differences(self):
+        return {"x": self.result.x - self.original.x, "y": self.result.y - self.original.y}
+
     def fixed_end_func(self):
         self.shape.set_pos(self.result.x, self.result.y)
 
@@ -58,9 +142,14 @@ class Move(AbstractEffect):
 
 class Resize(AbstractEffect):
     def __init__(self, shape, new_size, ticks, motion_class=_LinearChange, factor=1, fixed_end=True):
-        AbstractEffect.__init__(self, shape, (shape.width, shape.height), new_size, ticks, factor, fixed_end)
-        self.resize_width = motion_class(self.result[0] - self.shape.width, ticks)
-        self.resize_height = motion_class(self.result[1] - self.shape.height, ticks)
+        AbstractEffect.__init__(self, shape, (shape.width, shape.height), tuple(new_size), ticks, factor, fixed_end)
+        self.motion_class = motion_class
+        self.capture()
+
+    def capture(self):
+        self.original = (self.shape.width, self.shape.height)
+        self.resize_width = self.motion_class(self.result[0] - self.original[0], self.ticks)
+        self.resize_height = self.motion_class(self.result[1] - self.original[1], self.ticks)
 
     def shape_update(self):
         if self.fixed_end:
@@ -68,10 +157,13 @@ class Resize(AbstractEffect):
             height = self.original[1] + self.resize_height.s(self._counter)
             self.shape.set_size(width, height)
         else:
-            d_width = self.resize_width.v(self._counter)
-            d_height = self.resize_height.v(self._counter)
+            d_width = self._step(self.resize_width)
+            d_height = self._step(self.resize_height)
             self.shape.move_size(d_width, d_height)
 
+    def differences(self):
+        return {"width": self.result[0] - self.original[0], "height": self.result[1] - self.original[1]}
+
     def fixed_end_func(self):
         self.shape.set_size(self.result[0], self.result[1])
 
@@ -84,10 +176,15 @@ class Resize(AbstractEffect):
 
 class ColorTransition(AbstractEffect):
     def __init__(self, shape, new_color, ticks, motion_class=_LinearChange, factor=1, fixed_end=True):
-        AbstractEffect.__init__(self, shape, shape.color, new_color, ticks, factor, fixed_end)
-        self.change_r = motion_class(self.result.r - self.shape.color.r, ticks)
-        self.change_g = motion_class(self.result.g - self.shape.color.g, ticks)
-        self.change_b = motion_class(self.result.b - self.shape.color.b, ticks)
+        AbstractEffect.__init__(self, shape, _Color(shape.color), _Color(new_color), ticks, factor, fixed_end)
+        self.motion_class = motion_class
+        self.capture()
+
+    def capture(self):
+        self.original = _Color(self.shape.color)
+        self.change_r = self.motion_class(self.result.r - self.original.r, self.ticks)
+        self.change_g = self.motion_class(self.result.g - self.original.g, self.ticks)
+        self.change_b = self.motion_class(self.result.b - self.original.b, self.ticks)
 
     def shape_update(self):
         if self.fixed_end:
@@ -95,13 +192,17 @@ class ColorTransition(AbstractEffect):
             g = self.original.g + self.change_g.s(self._counter)
             b = self.original.b + self.change_b.s(self._counter)
         else:
-            r = self.shape.color.r + self.change_r.v(self._counter)
-            g = self.shape.color.g + self.change_g.v(self._counter)
-            b = self.shape.color.b + self.change_b.v(self._counter)
+            r = self.shape.color.r + self._step(self.change_r)
+            g = self.shape.color.g + self._step(self.change_g)
+            b = self.shape.color.b + self._step(self.change_b)
         self.shape.color.r = int(_clamp(r, 0, 255))
         self.shape.color.g = int(_clamp(g, 0, 255))
         self.shape.color.b = int(_clamp(b, 0, 255))
 
+    def differences(self):
+        return {"r": self.result.r - self.original.r, "g": self.result.g - self.original.g,
+                "b": self.result.b - self.original.b}
+
     def fixed_end_func(self):
         self.shape.color = self.result
 
@@ -112,17 +213,28 @@ class Rotate(AbstractEffect):
         Although this effect supports both fixed_end = True and fixed_end = False, it is advised to use fixed_end = True
         here given the complex nature of rotations and how, over time, precision gets lost with these functions.
         """
-        AbstractEffect.__init__(self, shape, shape.points, radians, ticks, factor, fixed_end)
+        AbstractEffect.__init__(self, shape, shape.snapshot_points(), radians, ticks, factor, fixed_end)
+        self.motion_class = motion_class
         self.radians_motion = motion_class(radians, ticks)
 
+    def capture(self):
+        self.original = self.shape.snapshot_points()
+
     def shape_update(self):
         if self.fixed_end:
             self.shape.set_points(self.original)
             radians = self.radians_motion.s(self._counter)
         else:
-            radians = self.radians_motion.v(self._counter)
+            radians = self._step(self.radians_motion)
         self.shape.rotate(radians)
 
+    def differences(self):
+        return {"angle": self.result}
+
+    def keyframes(self, start):
+        # The rotation is relative to the points at the start, so it doesn't depend on previous changes.
+        return AbstractEffect.keyframes(self, dict())
+
     def fixed_end_func(self):
         self.shape.set_points(self.original)
         self.shape.rotate(self.result)
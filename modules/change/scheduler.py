@@ -0,0 +1,134 @@
+from heapq import heappush as _heappush, heappop as _heappop
+
+
+class HeapScheduler:
+    """A class to represent a scheduler of timeline entries in a heap keyed on the tick they are due.
+
+    Entries are lists of [due tick, insertion count, event, tick of insertion]. An entry is cancelled by setting its
+    event to None, it is then dropped when it would have been due.
+    """
+
+    def __init__(self):
+        """Initiate HeapScheduler object."""
+        self.__heap = list()
+
+    def insert(self, entry):
+        """Insert entry, O(log n).
+
+        :type entry: list
+        """
+        _heappush(self.__heap, entry)
+
+    def pop_due(self, tick):
+        """Remove and get all entries that are due at or before tick and are not cancelled.
+
+        :param tick: current tick of the timeline
+        :type tick: int
+        :rtype: list of list
+        """
+        due = list()
+        while self.__heap and self.__heap[0][0] <= tick:
+            entry = _heappop(self.__heap)
+            if entry[2] is not None:
+                due.append(entry)
+        return due
+
+    def clear(self):
+        """Remove all entries."""
+        self.__heap.clear()
+
+
+class TimingWheel:
+    """A class to represent a scheduler of timeline entries in a hashed hierarchical timing wheel.
+
+    The wheel consists of levels of 2**bits slots. Level 0 has one slot per tick, every next level has slots that are
+    2**bits times as long. An entry is put in the level that matches how far in the future it is due, and moved down
+    a level (cascaded) when the slot of the higher level comes around. Insertion and cancellation are O(1), expiry is
+    amortized O(1) per entry. Entries that are due further away than the top level can cover wait in an overflow list.
+
+    Entries are lists of [due tick, insertion count, event, tick of insertion]. An entry is cancelled by setting its
+    event to None, it is then dropped when its slot is processed.
+    """
+
+    def __init__(self, bits=8, levels=4):
+        """Initiate TimingWheel object.
+
+        :param bits: 2**bits is the amount of slots per level
+        :type bits: int
+        :param levels: amount of levels
+        :type levels: int
+        """
+        self.bits = bits
+        self.levels = levels
+        self.current = 0
+        self.__mask = (1 << bits) - 1
+        self.__wheels = list(list(list() for _ in range(1 << bits)) for _ in range(levels))
+        self.__overflow = list()
+
+    def insert(self, entry):
+        """Insert entry, O(1).
+
+        :type entry: list
+        """
+        due = max(entry[0], self.current)
+        delta = due - self.current
+        for level in range(self.levels):
+            if delta < 1 << (self.bits * (level + 1)):
+                self.__wheels[level][(due >> (self.bits * level)) & self.__mask].append(entry)
+                return
+        self.__overflow.append(entry)
+
+    def __cascade(self, level):
+        """Move the entries of the current slot of a level down to lower levels.
+
+        :type level: int
+        """
+        wheel = self.__wheels[level]
+        index = (self.current >> (self.bits * level)) & self.__mask
+        entries = wheel[index]
+        wheel[index] = list()
+        for entry in entries:
+            if entry[2] is not None:
+                self.insert(entry)
+
+    def __advance(self):
+        """Advance one tick and get the entries of the new current slot of level 0.
+
+        :rtype: list of list
+        """
+        self.current += 1
+        for level in range(1, self.levels):
+            if self.current & ((1 << (self.bits * level)) - 1):
+                break
+            self.__cascade(level)
+        else:
+            overflow = self.__overflow
+            self.__overflow = list()
+            for entry in overflow:
+                if entry[2] is not None:
+                    self.insert(entry)
+
+        wheel = self.__wheels[0]
+        index = self.current & self.__mask
+        entries = wheel[index]
+        wheel[index] = list()
+        return entries
+
+    def pop_due(self, tick):
+        """Advance to tick, remove and get all entries that are due and are not cancelled.
+
+        :param tick: current tick of the timeline
+        :type tick: int
+        :rtype: list of list
+        """
+        due = list()
+        while self.current < tick:
+            due.extend(entry for entry in self.__advance() if entry[2] is not None)
+        return due
+
+    def clear(self):
+        """Remove all entries."""
+        for wheel in self.__wheels:
+            for slot in wheel:
+                slot.clear()
+        self.__overflow.clear()
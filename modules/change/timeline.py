@@ -1,57 +1,203 @@
+from ..logic.time import CountDown as _CountDown, CountUp as _CountUp, ResetTimer as _ResetTimer
+from ..logic.constants import Default as _Default
+from .scheduler import HeapScheduler as _HeapScheduler
+
+_SLEEPING_TICKS = (_CountDown.tick, _CountUp.tick, _ResetTimer.tick)
+
+
+class TimerToken:
+    """A class to represent the registration of an event on a timeline, used to cancel it."""
+
+    def __init__(self, timeline, event, entry):
+        self.timeline = timeline
+        self.event = event
+        self.entry = entry
+
+    def cancel(self):
+        self.timeline.cancel(self)
+
 
 class TimeLine:
-    def __init__(self, *events):
-        self.__events = list(*events)  # Currently TimeLine will only support CountDown objects
+    """A class to represent a collection of timers and effects that are updated once per application tick.
+
+    Timers that only execute their function when they run out (CountDown, CountUp and ResetTimer objects that don't
+    override tick) are kept in a scheduler keyed on the tick they are due, and are only woken up when due. Their
+    counter is brought up to date when they are woken up, removed, or when sync is called. Sleeping timers are
+    rescheduled when they are reset, started, stopped or given a new base, and timers stopped while asleep are dropped
+    at the next update, like the per-tick loop drops inactive events. All other events, such as
+    effects, are ticked every update. The scheduler is a HeapScheduler by default, a TimingWheel scales better for very
+    large amounts of timers.
+
+    When update is given the elapsed seconds, the timeline advances by as many ticks as fit in the elapsed time, and
+    events with an advance method (effects) are advanced by the elapsed seconds instead of being ticked. Frames can
+    then be dropped or merged without timers and effects drifting.
+    """
+
+    def __init__(self, *events, scheduler=None):
+        self.__tick = 0
+        self.__remainder = 0
+        self.__events = list()
+        self.__scheduler = _HeapScheduler() if scheduler is None else scheduler
+        self.__sleeping = dict()
+        self.__count = 0
+        for event in list(*events):  # Currently TimeLine will only support CountDown objects
+            self.__add(event)
+
+    def __add(self, event):
+        if type(event).tick in _SLEEPING_TICKS:
+            return self.__sleep(event)
+        self.__events.append(event)
+        return None
+
+    def __sleep(self, event):
+        if id(event) in self.__sleeping:
+            self.__sleeping[id(event)][2] = None
+        self.__count += 1
+        entry = [self.__tick + event.remaining(), self.__count, event, self.__tick]
+        self.__sleeping[id(event)] = entry
+        self.__scheduler.insert(entry)
+        event._timeline = self
+        return entry
+
+    def __wake(self, entry):
+        event = entry[2]
+        del self.__sleeping[id(event)]
+        if not event.get_active():
+            event._timeline = None
+            return
+        event.skip(self.__tick - entry[3] - 1)
+        event.tick()
+        if event.get_active():
+            self.__sleep(event)
+
+    def __sync(self, entry):
+        entry[2].skip(self.__tick - entry[3])
+        entry[3] = self.__tick
+
+    def __discard(self, event):
+        entry = self.__sleeping.pop(id(event), None)
+        if entry is None:
+            self.__events = list(active for active in self.__events if active is not event)
+        else:
+            self.__sync(entry)
+            entry[2] = None
+            event._timeline = None
+
+    def __get_entry(self, event):
+        entry = self.__sleeping.get(id(event))
+        if entry is not None and entry[2] is event:
+            return entry
+        return None
+
+    def __all(self):
+        return self.__events + list(entry[2] for entry in self.__sleeping.values())
+
+    def update(self, seconds=None):
+        if seconds is None:
+            steps = 1
+        else:
+            self.__remainder += seconds * _Default.ticks
+            steps = int(self.__remainder)
+            self.__remainder -= steps
+
+        for _ in range(steps):
+            self.__tick += 1
+            for entry in self.__scheduler.pop_due(self.__tick):
+                if entry[2] is not None:
+                    self.__wake(entry)
 
-    def update(self):
         for event in self.__events:
-            event.tick()
+            if seconds is None:
+                event.tick()
+            elif hasattr(event, "advance"):
+                event.advance(seconds)
+            else:
+                for _ in range(steps):
+                    event.tick()
         self.__events = list(event for event in self.__events if event.get_active())
-    
+
+    def sync(self):
+        for entry in self.__sleeping.values():
+            self.__sync(entry)
+
+    def sync_event(self, event):
+        entry = self.__get_entry(event)
+        if entry is not None:
+            self.__sync(entry)
+
+    def reschedule(self, event):
+        entry = self.__get_entry(event)
+        if entry is None:
+            return
+        if event.get_active():
+            self.__sleep(event)
+            return
+        # Stopped timers wake up at the next update, to be dropped there unless they are started again before it.
+        entry[2] = None
+        self.__count += 1
+        entry = [self.__tick + 1, self.__count, event, self.__tick]
+        self.__sleeping[id(event)] = entry
+        self.__scheduler.insert(entry)
+
     def append(self, event):
-        self.__events.append(event)
         event.start()
+        return TimerToken(self, event, self.__add(event))
+
+    def cancel(self, token):
+        # Sleeping timers get a new entry every time they are rescheduled, so they are cancelled by event.
+        self.__discard(token.event)
 
     def clear(self):
+        for entry in self.__sleeping.values():
+            entry[2]._timeline = None
         self.__events.clear()
+        self.__scheduler.clear()
+        self.__sleeping.clear()
 
     def count(self, event):
-        self.__events.count(event)
+        return self.__all().count(event)
 
     def extend(self, events):
-        self.extend(events)
         for event in events:
-            event.start()
+            self.append(event)
 
-    def index(self, event, start=0, stop=0):
-        self.__events.index(event, start, stop)
+    def index(self, event, start=0, stop=None):
+        if stop is None:
+            stop = len(self)
+        return self.__all().index(event, start, stop)
 
     def insert(self, index, event):
-        self.__events.insert(index, event)
         event.start()
+        if type(event).tick in _SLEEPING_TICKS:
+            return TimerToken(self, event, self.__sleep(event))
+        self.__events.insert(index, event)
+        return TimerToken(self, event, None)
 
-    def pop(self, index):
-        self.__events.pop(index)
+    def pop(self, index=-1):
+        event = self.__all()[index]
+        self.__discard(event)
+        return event
 
     def remove(self, event):
-        self.__events.remove(event)
+        self.__discard(event)
 
     def reverse(self):
         self.__events.reverse()
 
     def __getitem__(self, item):
-        return self.__events[item]
+        return self.__all()[item]
 
     def __iter__(self):
         self.__index = 0
+        self.__iterated = self.__all()
         return self
 
     def __len__(self):
-        return len(self.__events)
+        return len(self.__events) + len(self.__sleeping)
 
     def __next__(self):
-        if self.__index < len(self.__events):
-            shape = self.__events[self.__index]
+        if self.__index < len(self.__iterated):
+            shape = self.__iterated[self.__index]
             self.__index += 1
             return shape
         else:
@@ -0,0 +1,2 @@
+from .world import *
+from .systems import *
@@ -0,0 +1,250 @@
+from pygame import Surface as _Surface, SRCALPHA as _SRCALPHA, display as _display, draw as _draw
+
+from ..logic.constants import ColliderType as _ColliderType
+from ..particles.collision import ParticleCollider as _ParticleCollider
+
+try:
+    import numpy as _np
+except ImportError:
+    _np = None
+
+
+class MovementSystem:
+    """A class to move all entities of a World by their velocity."""
+
+    def __init__(self, drag=1, gravity=0):
+        """Initiate MovementSystem object.
+
+        :param drag: factor velocities are multiplied with every tick
+        :type drag: float
+        :param gravity: change of the y-velocity of all entities that aren't static every tick
+        :type gravity: float
+        """
+        self.drag = drag
+        self.gravity = gravity
+
+    def update(self, world):
+        """Accelerate, apply drag to and move all entities.
+
+        :type world: World
+        """
+        n = world.end
+        velocities = world.velocities[:n]
+        if self.gravity != 0:
+            velocities[:, 1] += _np.where(world.static[:n], 0, self.gravity)
+        if self.drag != 1:
+            velocities *= self.drag
+        world.positions[:n] += velocities
+
+
+class BoundsSystem:
+    """A class to bounce all entities of a World off the edges of a box."""
+
+    def __init__(self, x1, y1, x2, y2, restitution=1):
+        """Initiate BoundsSystem object.
+
+        :type x1: float
+        :type y1: float
+        :type x2: float
+        :type y2: float
+        :param restitution: fraction of the speed that is kept in a bounce
+        :type restitution: float
+        """
+        self.x1 = x1
+        self.y1 = y1
+        self.x2 = x2
+        self.y2 = y2
+        self.restitution = restitution
+
+    def update(self, world):
+        """Bounce all entities that are outside of the box back into it.
+
+        :type world: World
+        """
+        n = world.end
+        for axis, low, high in ((0, self.x1, self.x2), (1, self.y1, self.y2)):
+            position = world.positions[:n, axis]
+            velocity = world.velocities[:n, axis]
+            size = world.sizes[:n, axis]
+            below = (position < low) & (velocity < 0)
+            above = (position + size > high) & (velocity > 0)
+            velocity[below | above] *= -self.restitution
+            position[below] = low
+            position[above] = high - size[above]
+
+
+class CollisionSystem:
+    """A class to collide all entities of a World that have a collider.
+
+    Entities that aren't static are sorted into a uniform grid, like the particles of a ParticleCollider, and only
+    entities in the same or neighbouring cells are compared. Static entities, which are often large walls and floors,
+    are kept out of the grid and are compared with all other entities at once per static entity. Two circles collide
+    as circles, all other pairs collide as their bounding boxes and are pushed apart along the axis they overlap least.
+    """
+
+    def __init__(self, restitution=1, cell_size=None):
+        """Initiate CollisionSystem object.
+
+        :param restitution: fraction of the speed along the normal that is kept in a bounce
+        :type restitution: float
+        :param cell_size: size of the grid cells, the size of the largest entity by default
+        :type cell_size: float or None
+        """
+        if _np is None:
+            raise ImportError("Error: collision systems require numpy")
+        self.restitution = restitution
+        self.cell_size = cell_size
+        self.contacts = (_np.zeros(0, dtype=_np.intp), _np.zeros(0, dtype=_np.intp))
+        self._grid = _ParticleCollider()
+
+    def update(self, world):
+        """Push all overlapping entities apart and let them bounce off each other.
+
+        :type world: World
+        """
+        n = world.end
+        solid = world.alive[:n] & (world.colliders[:n] != _ColliderType.none)
+        dynamic = _np.flatnonzero(solid & ~world.static[:n])
+        static = _np.flatnonzero(solid & world.static[:n])
+        first, second = list(), list()
+
+        if len(dynamic) > 1:
+            centres = world.positions[dynamic] + world.sizes[dynamic] / 2
+            cell_size = self.cell_size if self.cell_size is not None else max(float(world.sizes[dynamic].max()), 1)
+            i, j = self._grid.pairs(centres[:, 0], centres[:, 1], cell_size)
+            first.append(dynamic[i])
+            second.append(dynamic[j])
+        for entity in static.tolist():
+            first.append(_np.full(len(dynamic), entity))
+            second.append(dynamic)
+
+        if len(first) == 0:
+            self.contacts = (_np.zeros(0, dtype=_np.intp), _np.zeros(0, dtype=_np.intp))
+            return
+        i, j = _np.concatenate(first), _np.concatenate(second)
+        nx, ny, push = self.overlap(world, i, j)
+        hit = push > 0
+        i, j, nx, ny, push = i[hit], j[hit], nx[hit], ny[hit], push[hit]
+        self.contacts = (i, j)
+        if len(i) > 0:
+            self.resolve(world, i, j, nx, ny, push)
+
+    @staticmethod
+    def overlap(world, i, j):
+        """Get the normal from the first to the second entity and the penetration depth of pairs of entities.
+
+        :type world: World
+        :type i: _np.ndarray
+        :type j: _np.ndarray
+        :return: normal and penetration depth, which is 0 or less for pairs that don't overlap
+        :rtype: (_np.ndarray, _np.ndarray, _np.ndarray)
+        """
+        half_i = world.sizes[i] / 2
+        half_j = world.sizes[j] / 2
+        d = world.positions[j] + half_j - world.positions[i] - half_i
+        overlap = half_i + half_j - _np.abs(d)
+        sign = _np.where(d >= 0, 1.0, -1.0)
+        along_x = overlap[:, 0] < overlap[:, 1]
+        nx = _np.where(along_x, sign[:, 0], 0)
+        ny = _np.where(along_x, 0, sign[:, 1])
+        push = _np.where((overlap > 0).all(axis=1), overlap.min(axis=1), 0)
+
+        circles = (world.colliders[i] == _ColliderType.circle) & (world.colliders[j] == _ColliderType.circle)
+        if circles.any():
+            radius = half_i[circles].min(axis=1) + half_j[circles].min(axis=1)
+            distance = _np.hypot(d[circles, 0], d[circles, 1])
+            apart = distance > 0
+            safe = _np.where(apart, distance, 1)
+            nx[circles] = _np.where(apart, d[circles, 0] / safe, 0)
+            ny[circles] = _np.where(apart, d[circles, 1] / safe, -1)
+            push[circles] = radius - distance
+        return nx, ny, push
+
+    def resolve(self, world, i, j, nx, ny, push):
+        """Push pairs of overlapping entities apart along their normal and let them bounce with equal mass.
+
+        Static entities are neither pushed nor bounced, the other entity of the pair takes the whole push and bounce.
+
+        :type world: World
+        :type i: _np.ndarray
+        :type j: _np.ndarray
+        :type nx: _np.ndarray
+        :type ny: _np.ndarray
+        :type push: _np.ndarray
+        """
+        static_i = world.static[i]
+        weight_i = _np.where(static_i, 0, 0.5)
+        weight_j = 1 - weight_i
+        velocity = world.velocities[j] - world.velocities[i]
+        normal_speed = velocity[:, 0] * nx + velocity[:, 1] * ny
+        impulse = _np.where(normal_speed < 0, -(1 + self.restitution) * normal_speed, 0)
+
+        # Changes are summed per entity with bincount, as an entity can be in many pairs.
+        n = world.end
+        for array, change in ((world.positions, push), (world.velocities, impulse)):
+            for axis, normal in ((0, nx), (1, ny)):
+                array[:n, axis] += (_np.bincount(j, change * weight_j * normal, n) -
+                                    _np.bincount(i, change * weight_i * normal, n))
+
+
+class RenderSystem:
+    """A class to draw all entities of a World without a shape with one Surface.blits call.
+
+    Entities are grouped by their size, color and collider type. One sprite is rendered per group, a filled rect or,
+    for circle colliders, a filled circle, the first time the group is drawn, and kept for later frames.
+    """
+
+    def __init__(self, max_cached=1024):
+        """Initiate RenderSystem object.
+
+        :param max_cached: amount of sprites after which all sprites are rendered again
+        :type max_cached: int
+        """
+        if _np is None:
+            raise ImportError("Error: render systems require numpy")
+        self.max_cached = max_cached
+        self._sprites = dict()
+
+    def _sprite(self, key):
+        """Get the sprite of a key, render it when it is not cached.
+
+        :param key: width, height, red, green, blue, alpha and collider type
+        :type key: tuple of int
+        :rtype: _Surface
+        """
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            width, height, r, g, b, a, collider = key
+            sprite = _Surface((width, height), _SRCALPHA)
+            if collider == _ColliderType.circle:
+                _draw.ellipse(sprite, (r, g, b, a), ((0, 0), (width, height)))
+            else:
+                sprite.fill((r, g, b, a))
+            if _display.get_surface() is not None:
+                sprite = sprite.convert_alpha()
+            if len(self._sprites) >= self.max_cached:
+                self._sprites.clear()
+            self._sprites[key] = sprite
+        return sprite
+
+    def draw(self, world, surface, alpha=1):
+        """Draw all visible entities of a world without a shape.
+
+        :type world: World
+        :type surface: _Surface
+        :param alpha: fraction between previous and current position of the entities
+        :type alpha: float
+        """
+        entities = world.unshaped()
+        sizes = _np.rint(world.sizes[entities]).astype(_np.int64)
+        visible = (sizes > 0).all(axis=1) & (world.colors[entities, 3] > 0)
+        entities, sizes = entities[visible], sizes[visible]
+        if len(entities) == 0:
+            return
+
+        positions = world.positions[entities] - world.velocities[entities] * (1 - alpha)
+        keys = _np.concatenate((sizes, world.colors[entities], world.colliders[entities, None]), axis=1)
+        keys, inverse = _np.unique(keys, axis=0, return_inverse=True)
+        sprites = _np.empty(len(keys), dtype=object)
+        sprites[:] = list(self._sprite(tuple(key)) for key in keys.tolist())
+        surface.blits(zip(sprites[inverse.reshape(-1)].tolist(), positions.astype(_np.int32).tolist()), False)
@@ -0,0 +1,237 @@
+from pygame import Color as _Color
+
+from ..logic.common import represent
+from ..logic.constants import ColliderType as _ColliderType
+from ..math.geometry import Circle as _Circle
+
+try:
+    import numpy as _np
+except ImportError:
+    _np = None
+
+# Names of the component arrays, which are all grown together.
+_COMPONENTS = ("alive", "static", "positions", "sizes", "colors", "velocities", "colliders")
+
+
+class World:
+    """A class to store entities as rows of contiguous component arrays.
+
+    Every entity is an index into the position, size, color, velocity and collider arrays, so systems can update all
+    entities in one vectorized step instead of calling a method on every shape. Indices of destroyed entities are kept
+    on a free-list and are given to new entities, and the arrays double in size when they are full.
+
+    Existing Rect shapes can be registered as entities. Their position and size are read into the arrays before the
+    systems are updated, and positions changed by the systems are written back with set_pos afterwards, so the shapes
+    can still be drawn, clicked and animated as usual. A World can be added to a Page like any shape.
+    """
+
+    def __init__(self, capacity=1024, systems=None, renderer=None):
+        """Initiate World object.
+
+        :param capacity: amount of entities the arrays have room for at first
+        :type capacity: int
+        :param systems: systems updated in order every tick
+        :type systems: list or None
+        :param renderer: system that draws the entities without a shape, or None
+        :type renderer: RenderSystem or None
+        """
+        if _np is None:
+            raise ImportError("Error: entity worlds require numpy")
+        self.capacity = 0
+        self.count = 0
+        self.end = 0
+        self.systems = list() if systems is None else list(systems)
+        self.renderer = renderer
+        self.shapes = dict()
+        self._entities = dict()
+        self._free = list()
+        self.alive = _np.zeros(0, dtype=bool)
+        self.static = _np.zeros(0, dtype=bool)
+        self.positions = _np.zeros((0, 2))
+        self.sizes = _np.zeros((0, 2))
+        self.colors = _np.zeros((0, 4), dtype=_np.uint8)
+        self.velocities = _np.zeros((0, 2))
+        self.colliders = _np.zeros(0, dtype=_np.int8)
+        self._grow(max(capacity, 1))
+
+    def _grow(self, capacity):
+        """Make room for capacity entities, keeping all components.
+
+        :type capacity: int
+        """
+        for name in _COMPONENTS:
+            array = getattr(self, name)
+            grown = _np.zeros((capacity,) + array.shape[1:], dtype=array.dtype)
+            grown[:self.end] = array[:self.end]
+            setattr(self, name, grown)
+        self.capacity = capacity
+
+    def create(self, x, y, width=0, height=0, color=(0, 0, 0), dx=0, dy=0, collider=_ColliderType.none,
+               static=False):
+        """Create an entity.
+
+        :type x: float
+        :type y: float
+        :type width: float
+        :type height: float
+        :type color: pygame.Color or tuple of int
+        :param dx: velocity along the x-axis
+        :type dx: float
+        :param dy: velocity along the y-axis
+        :type dy: float
+        :type collider: _ColliderType or int
+        :param static: entity is not moved by collisions, like a wall
+        :type static: bool
+        :return: entity, the index of its components
+        :rtype: int
+        """
+        if self._free:
+            entity = self._free.pop()
+        else:
+            if self.end == self.capacity:
+                self._grow(self.capacity * 2)
+            entity = self.end
+            self.end += 1
+        self.count += 1
+        self.alive[entity] = True
+        self.static[entity] = static
+        self.positions[entity] = x, y
+        self.sizes[entity] = width, height
+        self.colors[entity] = tuple(_Color(color))
+        self.velocities[entity] = dx, dy
+        self.colliders[entity] = collider
+        return entity
+
+    def destroy(self, entity):
+        """Destroy an entity and put its index on the free-list.
+
+        :type entity: int
+        """
+        shape = self.shapes.pop(entity, None)
+        if shape is not None:
+            del self._entities[id(shape)]
+        self.alive[entity] = False
+        self._free.append(entity)
+        self.count -= 1
+        if self.count == 0:
+            self.end = 0
+            self._free.clear()
+
+    def register(self, shape, dx=0, dy=0, collider=None, static=False):
+        """Create an entity for an existing Rect shape, which follows the position of the entity.
+
+        :type shape: _Rect
+        :type dx: float
+        :type dy: float
+        :param collider: collider type, a circle for Circle shapes and a box for other shapes by default
+        :type collider: _ColliderType or int or None
+        :type static: bool
+        :return: entity of the shape
+        :rtype: int
+        """
+        if collider is None:
+            collider = _ColliderType.circle if isinstance(shape, _Circle) else _ColliderType.box
+        color = getattr(shape, "color", None)
+        entity = self.create(shape.x, shape.y, shape.width, shape.height, (0, 0, 0) if color is None else color, dx,
+                             dy, collider, static)
+        self.shapes[entity] = shape
+        self._entities[id(shape)] = entity
+        return entity
+
+    def unregister(self, shape):
+        """Destroy the entity of a registered shape, the shape itself is left as it is.
+
+        :type shape: _Rect
+        """
+        self.destroy(self._entities[id(shape)])
+
+    def get_entity(self, shape):
+        """Get the entity of a registered shape.
+
+        :type shape: _Rect
+        :rtype: int or None
+        """
+        return self._entities.get(id(shape))
+
+    def living(self):
+        """Get all living entities.
+
+        :rtype: _np.ndarray
+        """
+        return _np.flatnonzero(self.alive[:self.end])
+
+    def unshaped(self):
+        """Get all living entities without a registered shape.
+
+        :rtype: _np.ndarray
+        """
+        alive = self.alive[:self.end].copy()
+        alive[list(self.shapes)] = False
+        return _np.flatnonzero(alive)
+
+    def sync_from_shapes(self):
+        """Read the position and size of all registered shapes into the component arrays."""
+        if not self.shapes:
+            return
+        entities = list(self.shapes)
+        shapes = self.shapes.values()
+        self.positions[entities] = list((shape.x, shape.y) for shape in shapes)
+        self.sizes[entities] = list((shape.width, shape.height) for shape in shapes)
+
+    def sync_to_shapes(self):
+        """Move all registered shapes whose entity was moved to the position of their entity."""
+        if not self.shapes:
+            return
+        entities = _np.fromiter(self.shapes, dtype=_np.intp, count=len(self.shapes))
+        previous = _np.array(list((shape.x, shape.y) for shape in self.shapes.values()), dtype=float)
+        positions = self.positions[entities]
+        moved = _np.flatnonzero((positions != previous).any(axis=1))
+        for entity, (x, y) in zip(entities[moved].tolist(), positions[moved].tolist()):
+            self.shapes[entity].set_pos(x, y)
+
+    def add_system(self, system):
+        """Add system that is updated after all other systems every tick.
+
+        :type system: MovementSystem or BoundsSystem or CollisionSystem
+        """
+        self.systems.append(system)
+
+    def remove_system(self, system):
+        """Remove system.
+
+        :type system: MovementSystem or BoundsSystem or CollisionSystem
+        """
+        self.systems.remove(system)
+
+    def loop_behavior(self):
+        """Read the registered shapes, update all systems in order and move the registered shapes."""
+        self.sync_from_shapes()
+        for system in self.systems:
+            system.update(self)
+        self.sync_to_shapes()
+
+    def draw(self, surface):
+        """Draw all entities without a shape with the renderer, registered shapes are drawn by their own page.
+
+        :type surface: pygame.Surface
+        """
+        if self.renderer is not None:
+            self.renderer.draw(self, surface)
+
+    def draw_interpolated(self, surface, alpha):
+        """Draw all entities without a shape with the renderer, between their previous and current position.
+
+        :type surface: pygame.Surface
+        :param alpha: fraction between previous and current position
+        :type alpha: float
+        """
+        if self.renderer is not None:
+            self.renderer.draw(self, surface, alpha)
+
+    def __len__(self):
+        """Return amount of living entities."""
+        return self.count
+
+    def __repr__(self):
+        """Return repr(self)."""
+        return represent("count capacity", self.count, self.capacity)
@@ -1,5 +1,7 @@
 from .common import *
 from .constants import *
 from .loaders import *
+from .archive import *
+from .cache import *
 from .time import *
 from .layout import *
@@ -0,0 +1,127 @@
+from mmap import mmap as _mmap, ACCESS_READ as _ACCESS_READ
+from io import BytesIO as _BytesIO
+from struct import Struct as _Struct
+from json import dumps as _dumps, loads as _loads
+from os import walk as _walk
+from os.path import join as _join, relpath as _relpath, getsize as _getsize, abspath as _abspath
+from shutil import copyfileobj as _copyfileobj
+from argparse import ArgumentParser as _ArgumentParser
+
+
+_MAGIC = b"PW2A"
+_HEADER = _Struct("<4sI")
+
+
+class Archive:
+    """A class to represent a packed archive of files, read through a memory-map.
+
+    An archive consists of a header (magic bytes and the byte size of the index), a json index mapping every file name
+    to its offset and size, and the concatenated contents of all files. Opening an archive costs one open call and
+    one memory-map, after which every file is read directly from memory.
+    """
+
+    def __init__(self, path):
+        """Initiate Archive object.
+
+        :param path: path to archive file
+        :type path: str
+        """
+        self.path = path
+        self._file = open(path, 'rb')
+        self._map = _mmap(self._file.fileno(), 0, access=_ACCESS_READ)
+        magic, index_size = _HEADER.unpack_from(self._map, 0)
+        if magic != _MAGIC:
+            self.close()
+            raise ValueError("Error: {} is not a valid archive".format(path))
+        self._start = _HEADER.size + index_size
+        self._index = _loads(bytes(self._map[_HEADER.size:self._start]).decode("utf-8"))
+
+    def names(self):
+        """Get the names of all files in the archive.
+
+        :rtype: list of str
+        """
+        return list(self._index)
+
+    def read(self, name):
+        """Get the content of a file without copying it.
+
+        :param name: name of the file, its path relative to the packed directory with forward slashes
+        :type name: str
+        :rtype: memoryview
+        """
+        offset, size = self._index[name]
+        start = self._start + offset
+        return memoryview(self._map)[start:start + size]
+
+    def open(self, name):
+        """Get the content of a file as a file object, for functions such as pygame.image.load.
+
+        :param name: name of the file, its path relative to the packed directory with forward slashes
+        :type name: str
+        :rtype: _BytesIO
+        """
+        return _BytesIO(self.read(name))
+
+    def close(self):
+        """Close memory-map and archive file."""
+        self._map.close()
+        self._file.close()
+
+    def __contains__(self, name):
+        """Return name in self."""
+        return name in self._index
+
+    def __len__(self):
+        """Return len(self)."""
+        return len(self._index)
+
+
+def build_archive(directory, path):
+    """Pack all files in a directory into one archive file.
+
+    :param directory: path to directory with files to pack
+    :type directory: str
+    :param path: path of archive file to create
+    :type path: str
+    :return: amount of packed files
+    :rtype: int
+    """
+    files = list()
+    for root, _, filenames in _walk(directory):
+        for filename in filenames:
+            full_path = _join(root, filename)
+            if _abspath(full_path) == _abspath(path):
+                continue
+            files.append((_relpath(full_path, directory).replace("\\", "/"), full_path))
+    files.sort()
+
+    index = dict()
+    offset = 0
+    for name, full_path in files:
+        size = _getsize(full_path)
+        index[name] = (offset, size)
+        offset += size
+
+    index_bytes = _dumps(index).encode("utf-8")
+    with open(path, 'wb') as archive:
+        archive.write(_HEADER.pack(_MAGIC, len(index_bytes)))
+        archive.write(index_bytes)
+        for _, full_path in files:
+            with open(full_path, 'rb') as file:
+                _copyfileobj(file, archive)
+    return len(files)
+
+
+def _main():
+    """Command line interface: pack an assets directory into an archive."""
+    parser = _ArgumentParser(description="Pack an assets directory into one archive file.")
+    parser.add_argument("directory", help="directory with files to pack")
+    parser.add_argument("archive", help="path of archive file to create")
+    arguments = parser.parse_args()
+    count = build_archive(arguments.directory, arguments.archive)
+    print("Packed {} files into {}".format(count, arguments.archive))
+
+
+if __name__ == '__main__':
+    _main()
@@ -0,0 +1,177 @@
+from pygame.image import tobytes as _tobytes, frombuffer as _frombuffer
+from atexit import register as _register, unregister as _unregister
+from hashlib import sha1 as _sha1
+from json import dumps as _dumps, loads as _loads
+from os import makedirs as _makedirs, replace as _replace, remove as _remove, listdir as _listdir, stat as _stat
+from os.path import join as _join, isfile as _isfile, abspath as _abspath
+from struct import Struct as _Struct
+from threading import Lock as _Lock, get_ident as _get_ident
+
+
+_MAGIC = b"PW2C"
+_HEADER = _Struct("<4sIII")
+
+
+class ImageCache:
+    """A class to represent an on-disk cache of decoded images, stored as raw RGBA pixel buffers.
+
+    Cache entries are keyed by the hash of the source file. The modification time and size of every source file are
+    kept in an index, so the source is only hashed again when it has changed. On a cache hit the pixels are read with
+    one read call and wrapped with frombuffer, without decoding the source. Changes to the index are written once per
+    flush, which loaders call after a batch of loads and which runs at exit, instead of once per new source file.
+    """
+
+    def __init__(self, directory):
+        """Initiate ImageCache object.
+
+        :param directory: path to directory to store cached images in, created when needed
+        :type directory: str
+        """
+        self.directory = directory
+        _makedirs(directory, exist_ok=True)
+        self._index_path = _join(directory, "index.json")
+        self._lock = _Lock()
+        self._dirty = False
+        try:
+            with open(self._index_path, 'r') as file:
+                self._index = _loads(file.read())
+        except (OSError, ValueError):
+            self._index = dict()
+        _register(self.flush)
+
+    def _hash(self, path):
+        """Get hash of source file, only reading the file if its modification time or size changed.
+
+        :param path: path to source file
+        :type path: str
+        :rtype: str
+        """
+        key = _abspath(path)
+        stat = _stat(path)
+        stamp = [stat.st_mtime_ns, stat.st_size]
+        entry = self._index.get(key)
+        if entry is not None and entry[:2] == stamp:
+            return entry[2]
+
+        sha = _sha1()
+        with open(path, 'rb') as file:
+            for chunk in iter(lambda: file.read(65536), b""):
+                sha.update(chunk)
+        digest = sha.hexdigest()
+        with self._lock:
+            self._index[key] = stamp + [digest]
+            self._dirty = True
+        return digest
+
+    def flush(self):
+        """Write the index to disk if it changed since the last flush."""
+        with self._lock:
+            if not self._dirty:
+                return
+            data = _dumps(self._index)
+            self._dirty = False
+        temporary_path = "{}.{}.tmp".format(self._index_path, _get_ident())
+        with open(temporary_path, 'w') as file:
+            file.write(data)
+        _replace(temporary_path, self._index_path)
+
+    def close(self):
+        """Write the index to disk and stop writing it at exit."""
+        self.flush()
+        _unregister(self.flush)
+
+    def _read(self, key):
+        """Read cached surfaces, or None if they are not cached.
+
+        :param key: name of the cache entry
+        :type key: str
+        :rtype: list of pygame.Surface or None
+        """
+        try:
+            with open(_join(self.directory, key + ".bin"), 'rb') as file:
+                data = file.read()
+        except OSError:
+            return None
+        if len(data) < _HEADER.size:
+            return None
+        magic, count, width, height = _HEADER.unpack_from(data)
+        size = width * height * 4
+        if magic != _MAGIC or len(data) != _HEADER.size + count * size:
+            return None
+
+        view = memoryview(data)
+        surfaces = list()
+        for i in range(count):
+            start = _HEADER.size + i * size
+            surfaces.append(_frombuffer(view[start:start + size], (width, height), "RGBA"))
+        return surfaces
+
+    def _write(self, key, surfaces):
+        """Write surfaces of equal size to the cache.
+
+        :param key: name of the cache entry
+        :type key: str
+        :type surfaces: list of pygame.Surface
+        """
+        width, height = surfaces[0].get_size()
+        path = _join(self.directory, key + ".bin")
+        temporary_path = "{}.{}.tmp".format(path, _get_ident())
+        with open(temporary_path, 'wb') as file:
+            file.write(_HEADER.pack(_MAGIC, len(surfaces), width, height))
+            for surface in surfaces:
+                file.write(_tobytes(surface, "RGBA"))
+        _replace(temporary_path, path)
+
+    def load(self, path, decode):
+        """Get image from the cache, decode and cache it when it is not cached.
+
+        :param path: path to source image
+        :type path: str
+        :param decode: function decoding the source image from path
+        :type decode: function
+        :return: image, not converted to the display format
+        :rtype: pygame.Surface
+        """
+        if not _isfile(path):
+            return decode(path)
+        key = self._hash(path)
+        surfaces = self._read(key)
+        if surfaces is None:
+            surfaces = [decode(path)]
+            self._write(key, surfaces)
+        return surfaces[0]
+
+    def load_frames(self, path, width, height, frame_count, slice_frames):
+        """Get frames sliced from an image from the cache, slice and cache them when they are not cached.
+
+        :param path: path to source image
+        :type path: str
+        :param width: width of one frame
+        :type width: int
+        :param height: height of one frame
+        :type height: int
+        :param frame_count: amount of frames to slice from image
+        :type frame_count: int
+        :param slice_frames: function returning the list of sliced frames
+        :type slice_frames: function
+        :return: frames, not converted to the display format
+        :rtype: list of pygame.Surface
+        """
+        if not _isfile(path):
+            return slice_frames()
+        key = "{}_{}x{}_{}".format(self._hash(path), width, height, frame_count)
+        frames = self._read(key)
+        if frames is None:
+            frames = slice_frames()
+            if len(frames) > 0:
+                self._write(key, frames)
+        return frames
+
+    def clear(self):
+        """Remove all cached images and the index."""
+        with self._lock:
+            for filename in _listdir(self.directory):
+                if filename.endswith(".bin") or filename == "index.json":
+                    _remove(_join(self.directory, filename))
+            self._index = dict()
+            self._dirty = False
@@ -1,4 +1,4 @@
-from .loaders import Fonts as _Fonts
+from .loaders import Fonts as _Fonts, Images as _Images
 from pygame import font as _font, error as _error, Surface as _Surface, SRCALPHA as _SRCALPHA
 from pygame.image import load as _load
 
@@ -58,7 +58,7 @@ def load_font(name, pt, bold=False, italic=False, underline=False):
 
 
 def frames_from_image(filename, width, height, frame_count):
-    """Load multiple surfaces from one image.
+    """Load multiple surfaces from one image, read from the image cache when Images has a cache set.
 
     :param filename: path to image
     :type filename: str
@@ -71,7 +71,27 @@ def frames_from_image(filename, width, height, frame_count):
     :return: frame list
     :rtype: list of _Surface
     """
-    image = _load(filename).convert_alpha()
+    if _Images.cache is not None:
+        frames = _Images.cache.load_frames(filename, width, height, frame_count,
+                                           lambda: _slice_frames(_load(filename), width, height, frame_count))
+        return list(frame.convert_alpha() for frame in frames)
+    return _slice_frames(_load(filename).convert_alpha(), width, height, frame_count)
+
+
+def _slice_frames(image, width, height, frame_count):
+    """Slice multiple surfaces from one surface.
+
+    :param image: surface to slice
+    :type image: _Surface
+    :param width: width of one surface
+    :type width: int
+    :param height: height of one surface
+    :type height: int
+    :param frame_count: amount of surfaces to slice from image
+    :type frame_count: int
+    :return: frame list
+    :rtype: list of _Surface
+    """
     frames = list()
     img_width = image.get_width()
     img_height = image.get_height()
@@ -88,6 +88,14 @@ class CharacterType:
     numeric = 2
 
 
+class ColliderType:
+    """A class to store constants about collider types of entities."""
+
+    none = 0
+    box = 1
+    circle = 2
+
+
 class ButtonState:
     """A class to store constants about button states."""
 
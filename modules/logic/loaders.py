@@ -1,6 +1,10 @@
 from pygame import image as _image
-from pygame.mixer import Sound as _Sound
+from pygame.mixer import Sound as _Sound, get_init as _mixer_get_init
 from typing import Sequence as _Sequence
+from collections import OrderedDict as _OrderedDict
+from os.path import getsize as _getsize
+from .cache import ImageCache as _ImageCache
+from concurrent.futures import ThreadPoolExecutor as _ThreadPoolExecutor, wait as _wait
 
 
 class _File:
@@ -18,6 +22,41 @@ class _File:
         self.content = content
 
 
+class _FutureFile(_File):
+    """A class to represent a file with a path of which the content is still being loaded by a worker thread."""
+
+    def __init__(self, path, future, finish):
+        """Initiate _FutureFile object, inheriting from _File class.
+
+        :param path: path to file
+        :type path: str
+        :param future: future of the worker thread opening the file
+        :type future: concurrent.futures.Future
+        :param finish: function applied to the opened content on the thread that first gets the content
+        :type finish: function
+        """
+        _File.__init__(self, path, None)
+        self.future = future
+        self.finish = finish
+
+    def done(self):
+        """Check if the worker thread is done opening the file.
+
+        :rtype: bool
+        """
+        return self.future.done()
+
+    def result(self):
+        """Wait for the worker thread to open the file and finish its content.
+
+        :return: opened and finished content of file
+        :rtype: object
+        """
+        if self.content is None:
+            self.content = self.finish(self.future.result())
+        return self.content
+
+
 class _VariableLoader:
     """A class to represent a dictionary to store variables in."""
 
@@ -67,57 +106,428 @@ class _VariableLoader:
         """
         return self.get(item)
 
+    def __contains__(self, item):
+        """key in x
+
+        :param item: key, name of the variable
+        :type item: str
+        :rtype: bool
+        """
+        return item in self._loaded
+
 
 class _FileLoader(_VariableLoader):
-    """A class to represent a dictionary to store files in."""
+    """A class to represent a dictionary to store files in.
+
+    Files can be loaded directly with load, or on a worker thread with load_async. When a file loaded with load_async
+    is not done loading yet, get will either wait for it (blocking) or return the placeholder.
+
+    In lazy mode, load only records the path and the file is opened on the first get. The byte size of every opened
+    file is tracked, and when a budget is set, the least recently used files that are not pinned are unloaded until the
+    total size fits the budget again. Unloaded files keep their path and are opened again on the next get.
+
+    Paths found in a mounted Archive are read from its memory-map instead of from their own file.
+    """
+
+    max_workers = 4
+    _executor = None
+
+    def __init__(self):
+        """Initiate _FileLoader object, inheriting from _VariableLoader class."""
+        _VariableLoader.__init__(self)
+        self.blocking = True
+        self.placeholder = None
+        self.lazy = False
+        self.budget = None
+        self.used_bytes = 0
+        self._used = _OrderedDict()
+        self._pinned = set()
+        self.archives = list()
+
+    @staticmethod
+    def _get_executor():
+        """Get the worker pool shared by all file loaders, create it when needed.
+
+        :rtype: _ThreadPoolExecutor
+        """
+        if _FileLoader._executor is None:
+            _FileLoader._executor = _ThreadPoolExecutor(_FileLoader.max_workers, "loader")
+        return _FileLoader._executor
+
+    def _source(self, path):
+        """Get file object from the first mounted archive containing path, or path itself if no archive contains it.
+
+        :param path: path to file to open
+        :type path: str
+        :rtype: io.BytesIO or str
+        """
+        for archive in self.archives:
+            if path in archive:
+                return archive.open(path)
+        return path
+
+    def _open(self, path):
+        """Open file, safe to be called from a worker thread.
+
+        :param path: path to file to open
+        :type path: str
+        :return: opened content of file
+        :rtype: object
+        """
+        source = self._source(path)
+        if source is path:
+            return open(path, 'rb')
+        return source
+
+    def _finish(self, content):
+        """Finish opened content of file, called from the thread that first gets the content.
+
+        :param content: opened content of file
+        :type content: object
+        :return: finished content of file
+        :rtype: object
+        """
+        return content
+
+    def _get_size(self, content):
+        """Get the amount of bytes in memory of opened content of file.
+
+        :param content: finished content of file
+        :type content: object
+        :rtype: int
+        """
+        if hasattr(content, "getbuffer"):
+            return content.getbuffer().nbytes
+        return _getsize(content.name)
+
+    def _release(self, content):
+        """Release opened content of file when it is unloaded.
+
+        :param content: finished content of file
+        :type content: object
+        """
+        if hasattr(content, "close"):
+            content.close()
+
+    def _add_used(self, name):
+        """Track byte size of a newly opened file and unload other files if the budget is exceeded.
+
+        :param name: key, name of the file
+        :type name: str
+        """
+        size = self._get_size(self._loaded[name].content)
+        self._used[name] = size
+        self.used_bytes += size
+        self._evict(name)
+
+    def _remove_used(self, name):
+        """Stop tracking byte size of a file.
+
+        :param name: key, name of the file
+        :type name: str
+        """
+        if name in self._used:
+            self.used_bytes -= self._used.pop(name)
+
+    def _evict(self, keep=None):
+        """Unload least recently used files that are not pinned until the total byte size fits the budget.
+
+        :param keep: key, name of a file that should not be unloaded
+        :type keep: str or None
+        """
+        if self.budget is None:
+            return
+        for name in list(self._used):
+            if self.used_bytes <= self.budget:
+                break
+            if name != keep and name not in self._pinned:
+                self.unload(name)
+
+    def set_blocking(self, blocking, placeholder=None):
+        """Set the policy of get for files that are not done loading.
+
+        :param blocking: wait for the file to be loaded, or return placeholder
+        :type blocking: bool
+        :param placeholder: content to return while the file is loading when not blocking
+        :type placeholder: object
+        """
+        self.blocking = blocking
+        self.placeholder = placeholder
+
+    def mount(self, archive):
+        """Mount archive, so paths it contains are read from the archive instead of from their own file.
+
+        :type archive: logic.archive.Archive
+        """
+        self.archives.append(archive)
+
+    def unmount(self, archive):
+        """Unmount archive, so paths it contains are read from their own file again.
+
+        :type archive: logic.archive.Archive
+        """
+        self.archives.remove(archive)
+
+    def set_lazy(self, lazy):
+        """Set lazy mode, only recording the path on load and opening the file on the first get.
+
+        :type lazy: bool
+        """
+        self.lazy = lazy
+
+    def set_budget(self, budget):
+        """Set the maximum amount of bytes of opened files and unload files if the budget is exceeded.
+
+        :param budget: maximum amount of bytes, or None for no maximum
+        :type budget: int or None
+        """
+        self.budget = budget
+        self._evict()
+
+    def pin(self, name):
+        """Pin file, so it is never unloaded to fit the budget.
+
+        :param name: key, name of the file
+        :type name: str
+        """
+        self._pinned.add(name)
+
+    def unpin(self, name):
+        """Unpin file, so it can be unloaded to fit the budget again.
+
+        :param name: key, name of the file
+        :type name: str
+        """
+        self._pinned.discard(name)
+        self._evict()
+
+    def get_size(self, name):
+        """Get the amount of bytes in memory of a file, 0 if it is not opened.
+
+        :param name: key, name of the file
+        :type name: str
+        :rtype: int
+        """
+        return self._used.get(name, 0)
 
     def load(self, name, path):
-        """Load file.
+        """Load file, or only record its path in lazy mode.
 
         :param name: key, name of the file
         :type name: str
         :param path: path to file to open
         :type path: str
         """
-        self._loaded[name] = _File(path, open(path, 'rb'))
+        self.unload(name)
+        if self.lazy:
+            self._loaded[name] = _File(path, None)
+        else:
+            self._loaded[name] = _File(path, self._finish(self._open(path)))
+            self._add_used(name)
+
+    def get_path(self, name):
+        """Get path of file.
+
+        :param name: key, name of the file
+        :type name: str
+        :rtype: str
+        """
+        return self._loaded[name].path
+
+    def is_loaded(self, name):
+        """Check if file is opened or being opened by a worker thread.
+
+        :param name: key, name of the file
+        :type name: str
+        :rtype: bool
+        """
+        file = self._loaded.get(name)
+        return file is not None and (type(file) is _FutureFile or file.content is not None)
+
+    def unload(self, name):
+        """Release opened content of file, keeping its path to open it again on the next get.
+
+        :param name: key, name of the file
+        :type name: str
+        """
+        file = self._loaded.get(name)
+        if file is None:
+            return
+        if type(file) is _FutureFile:
+            file.future.cancel()
+            self._loaded[name] = _File(file.path, None)
+        elif file.content is not None:
+            self._remove_used(name)
+            self._release(file.content)
+            file.content = None
+
+    def load_async(self, name, path):
+        """Load file on a worker thread.
+
+        :param name: key, name of the file
+        :type name: str
+        :param path: path to file to open
+        :type path: str
+        :return: future of the worker thread opening the file
+        :rtype: concurrent.futures.Future
+        """
+        self.unload(name)
+        future = _FileLoader._get_executor().submit(self._open, path)
+        self._loaded[name] = _FutureFile(path, future, self._finish)
+        return future
 
     def get(self, name):
         """Get file.
 
         :param name: key, name of the file
         :type name: str
-        :return: content of file to get
+        :return: content of file to get, or placeholder if file is loading and loader is not blocking
         :rtype: object
         """
+        file = self._loaded[name]
+        if type(file) is _FutureFile:
+            if not self.blocking and not file.done():
+                return self.placeholder
+            self._loaded[name] = _File(file.path, file.result())
+            self._add_used(name)
+        elif file.content is None:
+            file.content = self._finish(self._open(file.path))
+            self._add_used(name)
+        elif name in self._used:
+            self._used.move_to_end(name)
         return self._loaded[name].content
 
+    def pending(self):
+        """Get the amount of files that are not done loading.
+
+        :rtype: int
+        """
+        return sum(1 for file in self._loaded.values() if type(file) is _FutureFile and not file.done())
+
+    def wait_all(self, timeout=None):
+        """Wait for all files that are loading and finish them.
+
+        :param timeout: maximum amount of seconds to wait, or None to wait until all files are loaded
+        :type timeout: float or None
+        :return: if all files are done loading
+        :rtype: bool
+        """
+        futures = list(file.future for file in self._loaded.values() if type(file) is _FutureFile)
+        not_done = _wait(futures, timeout).not_done
+        for name, file in list(self._loaded.items()):
+            if type(file) is _FutureFile and file.done():
+                self.get(name)
+        return len(not_done) == 0
+
 
 class _ImageLoader(_FileLoader):
-    """A class to represent a dictionary to store images in."""
+    """A class to represent a dictionary to store images in.
 
-    def load(self, name, path):
-        """Load image.
+    When a cache is set, decoded images are stored on disk as raw pixels and read from there on the next launch.
+    """
+
+    def __init__(self):
+        """Initiate _ImageLoader object, inheriting from _FileLoader class."""
+        _FileLoader.__init__(self)
+        self.cache = None
+
+    def set_cache(self, directory):
+        """Set directory of the on-disk cache of decoded images.
+
+        :param directory: path to directory to store cached images in, or None to disable the cache
+        :type directory: str or None
+        """
+        if self.cache is not None:
+            self.cache.close()
+        if directory is None:
+            self.cache = None
+        else:
+            self.cache = _ImageCache(directory)
+
+    def wait_all(self, timeout=None):
+        """Wait for all images that are loading and finish them, then write the index of the cache once.
+
+        :param timeout: maximum amount of seconds to wait, or None to wait until all images are loaded
+        :type timeout: float or None
+        :return: if all images are done loading
+        :rtype: bool
+        """
+        done = _FileLoader.wait_all(self, timeout)
+        if self.cache is not None:
+            self.cache.flush()
+        return done
+
+    def _decode(self, path):
+        """Decode image from its source.
+
+        :param path: path to image to decode
+        :type path: str
+        :rtype: pygame.Surface
+        """
+        return _image.load(self._source(path), path)
+
+    def _open(self, path):
+        """Decode image or read it from the cache, safe to be called from a worker thread.
 
-        :param name: key, name of the image
-        :type name: str
         :param path: path to image to open
         :type path: str
+        :return: decoded image
+        :rtype: pygame.Surface
         """
-        self._loaded[name] = _File(path, _image.load(path).convert_alpha())
+        if self.cache is not None:
+            return self.cache.load(path, self._decode)
+        return self._decode(path)
+
+    def _finish(self, content):
+        """Convert decoded image to the display format, must be called from the main thread.
+
+        :param content: decoded image
+        :type content: pygame.Surface
+        :return: converted image
+        :rtype: pygame.Surface
+        """
+        return content.convert_alpha()
+
+    def _get_size(self, content):
+        """Get the amount of bytes in memory of a converted image.
+
+        :param content: converted image
+        :type content: pygame.Surface
+        :rtype: int
+        """
+        return content.get_width() * content.get_height() * content.get_bytesize()
 
 
 class _SoundLoader(_FileLoader):
     """A class to represent a dictionary to store sounds in."""
 
-    def load(self, name, path):
-        """Load sound.
+    def _open(self, path):
+        """Decode sound, safe to be called from a worker thread.
 
-        :param name: key, name of the sound
-        :type name: str
         :param path: path to sound to open
         :type path: str
+        :return: decoded sound
+        :rtype: _Sound
+        """
+        return _Sound(self._source(path))
+
+    def _get_size(self, content):
+        """Get the amount of bytes in memory of a decoded sound.
+
+        :param content: decoded sound
+        :type content: _Sound
+        :rtype: int
         """
-        self._loaded[name] = _File(path, _Sound(path))
+        frequency, size, channels = _mixer_get_init()
+        return int(content.get_length() * frequency) * channels * abs(size) // 8
+
+    def _release(self, content):
+        """Stop decoded sound before releasing its reference.
+
+        :param content: decoded sound
+        :type content: _Sound
+        """
+        content.stop()
 
 
 class FunctionLoader:
@@ -173,3 +583,81 @@ Variables = _VariableLoader()
 Fonts = _VariableLoader()
 Images = _ImageLoader()
 Sounds = _SoundLoader()
+
+
+def wait_all(timeout=None):
+    """Wait for all images and sounds that are loading and finish them, meant for loading screens.
+
+    :param timeout: maximum amount of seconds to wait per loader, or None to wait until all files are loaded
+    :type timeout: float or None
+    :return: if all files are done loading
+    :rtype: bool
+    """
+    return all(list(loader.wait_all(timeout) for loader in (Images, Sounds)))
+
+
+def mount(archive):
+    """Mount archive on the image and sound loaders.
+
+    :type archive: logic.archive.Archive
+    """
+    for loader in (Images, Sounds):
+        loader.mount(archive)
+
+
+class AssetManifest:
+    """A class to represent the images, sounds and fonts a page needs, to load them before the page is shown."""
+
+    def __init__(self, images=None, sounds=None, fonts=None):
+        """Initiate AssetManifest object.
+
+        :param images: names of images mapped to their paths
+        :type images: dict or None
+        :param sounds: names of sounds mapped to their paths
+        :type sounds: dict or None
+        :param fonts: names of fonts mapped to their paths
+        :type fonts: dict or None
+        """
+        self.images = dict() if images is None else dict(images)
+        self.sounds = dict() if sounds is None else dict(sounds)
+        self.fonts = dict() if fonts is None else dict(fonts)
+
+    def _loaders(self):
+        """Get pairs of file loaders and the assets they should load.
+
+        :rtype: tuple of (_FileLoader, dict)
+        """
+        return (Images, self.images), (Sounds, self.sounds)
+
+    def prefetch(self):
+        """Load all assets that are not loaded yet on worker threads."""
+        for name, path in self.fonts.items():
+            if name not in Fonts:
+                Fonts.load(name, path)
+        for loader, assets in self._loaders():
+            for name, path in assets.items():
+                if not loader.is_loaded(name) or loader.get_path(name) != path:
+                    loader.load_async(name, path)
+
+    def wait(self, timeout=None):
+        """Wait for all assets to be loaded.
+
+        :param timeout: maximum amount of seconds to wait per loader, or None to wait until all assets are loaded
+        :type timeout: float or None
+        :return: if all assets are done loading
+        :rtype: bool
+        """
+        return all(list(loader.wait_all(timeout) for loader, _ in self._loaders()))
+
+    def release(self, keep=None):
+        """Unload all images and sounds, except the ones another manifest also needs.
+
+        :param keep: manifest of which the assets should stay loaded
+        :type keep: AssetManifest or None
+        """
+        if keep is None:
+            keep = AssetManifest()
+        for loader, assets, kept in ((Images, self.images, keep.images), (Sounds, self.sounds, keep.sounds)):
+            for name in assets:
+                if name not in kept:
+                    loader.unload(name)
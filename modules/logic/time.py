@@ -1,12 +1,53 @@
 from .constants import Default as _Default
 from .loaders import FunctionLoader as _FunctionLoader
-from copy import deepcopy as _deepcopy
 from math import inf as _inf
 from collections.abc import Sequence as _Sequence
+from functools import wraps as _wraps
+
+_slot_names = dict()
+
+
+def _get_slot_names(cls):
+    """Get the names of all slots of a class and its bases, cached per class.
+
+    :type cls: type
+    :rtype: tuple of str
+    """
+    names = _slot_names.get(cls)
+    if names is None:
+        names = tuple(name for base in cls.__mro__ for name in base.__dict__.get("__slots__", ()))
+        _slot_names[cls] = names
+    return names
+
+
+def _reschedules(method):
+    """Decorate a Timer method that changes when the timer runs out, so a timeline it is asleep in is updated.
+
+    The counter is brought up to date before the change and the timer is put back in the scheduler of the timeline
+    after it, so the tick it is due matches remaining() again.
+
+    :type method: function
+    :rtype: function
+    """
+    @_wraps(method)
+    def wrapper(self, *args, **kwargs):
+        timeline = self._timeline
+        if timeline is None:
+            return method(self, *args, **kwargs)
+        timeline.sync_event(self)
+        result = method(self, *args, **kwargs)
+        timeline.reschedule(self)
+        return result
+    return wrapper
 
 
 class Time:
-    """A class to represent a timestamp with seconds, minutes and hours."""
+    """A class to represent a timestamp with seconds, minutes and hours.
+
+    Time and its subclasses in this module are slotted, subclasses elsewhere (effects, LoopRect) get a __dict__.
+    """
+
+    __slots__ = ("_counter", "_factor")
 
     def __init__(self, counter=0, factor=1):
         """Initiate Time object.
@@ -51,13 +92,25 @@ class Time:
         """
         return self._factor
 
+    def copy(self):
+        """Get a copy of self, used by arithmetic operators instead of the much slower deepcopy.
+
+        :rtype: Time
+        """
+        timer = type(self).__new__(type(self))
+        for name in _get_slot_names(type(self)):
+            setattr(timer, name, getattr(self, name))
+        if hasattr(self, "__dict__"):
+            timer.__dict__.update(self.__dict__)
+        return timer
+
     def milliseconds(self):
         """Get the amount of milliseconds.
 
         :return: milliseconds
         :rtype: float
         """
-        return self._counter / self._factor * 1000
+        return self.get_counter() / self._factor * 1000
 
     def seconds(self):
         """Get the amount of seconds.
@@ -65,7 +118,7 @@ class Time:
         :return: seconds
         :rtype: int
         """
-        return self._counter // self._factor
+        return self.get_counter() // self._factor
 
     def minutes(self):
         """Get the amount of minutes.
@@ -110,67 +163,67 @@ class Time:
 
     def __add__(self, other):
         """Return self + other"""
-        timer = _deepcopy(self)
+        timer = self.copy()
         timer._counter += other.get_counter() * timer._factor
         return timer
 
     def __sub__(self, other):
         """Return self - other."""
-        timer = _deepcopy(self)
+        timer = self.copy()
         timer._counter -= other.get_counter() * timer._factor
         return timer
 
     def __mul__(self, other):
         """Return self * other."""
-        timer = _deepcopy(self)
+        timer = self.copy()
         timer._counter *= other
         return timer
 
     def __truediv__(self, other):
         """Return self / other."""
-        timer = _deepcopy(self)
+        timer = self.copy()
         timer._counter /= other
         return timer
 
     def __floordiv__(self, other):
         """Return self // other."""
-        timer = _deepcopy(self)
+        timer = self.copy()
         timer._counter //= other
         return timer
 
     def __mod__(self, other):
         """Return self % other."""
-        timer = _deepcopy(self)
+        timer = self.copy()
         timer._counter %= other
         return timer
 
     def __and__(self, other):
         """Return self & other."""
-        timer = _deepcopy(self)
+        timer = self.copy()
         timer._counter &= other
         return timer
 
     def __xor__(self, other):
         """Return self ^ other."""
-        timer = _deepcopy(self)
+        timer = self.copy()
         timer._counter ^= other
         return timer
 
     def __invert__(self):
         """Return ~self."""
-        timer = _deepcopy(self)
+        timer = self.copy()
         timer._counter = ~self._counter
         return timer
 
     def __or__(self, other):
         """Return self | other."""
-        timer = _deepcopy(self)
+        timer = self.copy()
         timer._counter |= other
         return timer
 
     def __pow__(self, power):
         """Return self**power."""
-        timer = _deepcopy(self)
+        timer = self.copy()
         timer._counter = pow(timer._counter, power)
         return timer
 
@@ -317,11 +370,11 @@ class Time:
 
     def __float__(self):
         """Return float(self)."""
-        return self._counter / self._factor
+        return self.get_counter() / self._factor
 
     def __bool__(self):
         """Return self != 0."""
-        return self._counter != 0
+        return self.get_counter() != 0
 
     @staticmethod
     def in_seconds(seconds, factor):
@@ -350,7 +403,13 @@ class Time:
 
 
 class Timer(Time):
-    """A class to represent a timestamp that can be activated to increase its value."""
+    """A class to represent a timestamp that can be activated to increase its value.
+
+    Timers asleep in a TimeLine keep a reference to it in _timeline, so methods that change when they run out can
+    reschedule them, and methods that read the counter can bring it up to date first.
+    """
+
+    __slots__ = ("_active", "_timeline")
 
     def __init__(self, counter=0, factor=1):
         """Initiate Timer object, inheriting from Time class.
@@ -362,7 +421,42 @@ class Timer(Time):
         """
         Time.__init__(self, counter, factor)
         self._active = False
+        self._timeline = None
+
+    def _sync(self):
+        """Bring the counter of a timer asleep in a timeline up to date."""
+        if self._timeline is not None:
+            self._timeline.sync_event(self)
+
+    def get_counter(self):
+        """Get counter.
+
+        :return: the amount of time, unconverted
+        :rtype: int
+        """
+        self._sync()
+        return self._counter
+
+    def copy(self):
+        """Get a copy of self that isn't asleep in any timeline.
+
+        :rtype: Timer
+        """
+        self._sync()
+        timer = Time.copy(self)
+        timer._timeline = None
+        return timer
 
+    @_reschedules
+    def set_counter(self, counter):
+        """set counter to a given value.
+
+        :param counter: the amount of time
+        :type counter: int
+        """
+        self._counter = counter
+
+    @_reschedules
     def set_active(self, active):
         """Set active to a certain value.
 
@@ -384,18 +478,22 @@ class Timer(Time):
         if self._active:
             self._counter += 1
 
+    @_reschedules
     def start(self):
         """Set active to True."""
         self._active = True
 
+    @_reschedules
     def stop(self):
         """Set active to False."""
         self._active = False
 
+    @_reschedules
     def toggle_active(self):
         """Toggle active value."""
         self._active = not self._active
 
+    @_reschedules
     def reset(self, active=False):
         """Reset counter and active value.
 
@@ -434,6 +532,8 @@ class Timer(Time):
 class CountDown(Timer):
     """A class to represent a timestamp that can be activated to count down and stops at 0."""
 
+    __slots__ = ("_base", "_function")
+
     def __init__(self, counter=0, factor=1, func=None):
         """Initiate CountDown object, inheriting from Timer class.
 
@@ -448,6 +548,15 @@ class CountDown(Timer):
         self._base = counter
         self._function = _FunctionLoader.from_variable(func)
 
+    def copy(self):
+        """Get a copy of self with its own copy of the function and parameters.
+
+        :rtype: CountDown
+        """
+        timer = Timer.copy(self)
+        timer._function = _FunctionLoader(self._function.function, *self._function.parameters)
+        return timer
+
     def set_function(self, func):
         """Set function to a certain value.
 
@@ -464,6 +573,7 @@ class CountDown(Timer):
         """
         self._function.set_parameters(*params)
 
+    @_reschedules
     def set_base(self, base):
         """Set base to a certain value.
 
@@ -481,6 +591,21 @@ class CountDown(Timer):
         """
         return self._base
 
+    def remaining(self):
+        """Get the amount of ticks until the function is executed.
+
+        :rtype: int
+        """
+        return max(self.get_counter(), 1)
+
+    def skip(self, ticks):
+        """Change counter as if it ticked a given amount of times, without executing the function.
+
+        :param ticks: amount of ticks to skip, smaller than remaining()
+        :type ticks: int
+        """
+        self._counter -= ticks
+
     def tick(self):
         """Decrease counter if active, reset and execute function when countdown is at 0."""
         if self._active:
@@ -489,6 +614,7 @@ class CountDown(Timer):
                 self._active = False
                 self._function.execute()
 
+    @_reschedules
     def reset(self, active=False):
         """Reset countdown."""
         self._counter = self._base
@@ -527,6 +653,8 @@ class CountDown(Timer):
 class CountUp(CountDown):
     """A class to represent a timestamp that can be activated to count up and stops at maximum."""
 
+    __slots__ = ()
+
     def __init__(self, maximum, factor=1, func=None):
         """Initiate CountUp object, inheriting from CountDown class.
 
@@ -540,6 +668,7 @@ class CountUp(CountDown):
         CountDown.__init__(self, maximum, factor, func)
         self._counter = 0
 
+    @_reschedules
     def set_base(self, maximum):
         """Set base to a certain value.
 
@@ -549,6 +678,21 @@ class CountUp(CountDown):
         self._base = maximum
         self._counter = 0
 
+    def remaining(self):
+        """Get the amount of ticks until the function is executed.
+
+        :rtype: int
+        """
+        return max(self._base - self.get_counter(), 1)
+
+    def skip(self, ticks):
+        """Change counter as if it ticked a given amount of times, without executing the function.
+
+        :param ticks: amount of ticks to skip, smaller than remaining()
+        :type ticks: int
+        """
+        self._counter += ticks
+
     def tick(self):
         """Increase counter if active, reset and execute function when countup is at base."""
         if self._active:
@@ -557,6 +701,7 @@ class CountUp(CountDown):
                 self._active = False
                 self._function.execute()
 
+    @_reschedules
     def reset(self, active=False):
         """Reset countup."""
         self._counter = 0
@@ -593,6 +738,8 @@ class CountUp(CountDown):
 
 
 class ResetTimer(CountUp):
+    __slots__ = ("_max_iter_base", "_max_iter")
+
     def __init__(self, maximum, factor=1, func=None, max_iter=_inf):
         """Initiate ResetTimer object, inheriting from CountUp class.
 
@@ -622,6 +769,7 @@ class ResetTimer(CountUp):
                 else:
                     self._counter = 0
 
+    @_reschedules
     def reset(self, active=False):
         """Reset reset-timer."""
         self._counter = 0
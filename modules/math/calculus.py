@@ -1,8 +1,12 @@
 from math import pi as _pi, sin as _sin, cos as _cos, log as _log
+from functools import partial as _partial
 
 
 class AbstractChange:
-    """A class to contain the constructors of its functions without any of the definitions."""
+    """A class to contain the constructors of its functions without any of the definitions.
+
+    All functions are continuous in t, so they can be evaluated at fractional ticks as well as at whole ticks.
+    """
 
     def a(self, t): ...
     def v(self, t): ...
@@ -29,8 +33,8 @@ class LinearChange(AbstractChange):
         Linear change means instant acceleration at the start and instant deceleration at the end to maintain a constant
         speed. In between, speed is not changed, therefore acceleration is 0.
 
-        :param t: elapsed ticks
-        :type t: int
+        :param t: elapsed ticks, can be fractional for time based changes
+        :type t: float
         :return: acceleration
         :rtype: float
         """
@@ -45,8 +49,8 @@ class LinearChange(AbstractChange):
 
         Derivative from s(t).
 
-        :param t: elapsed ticks
-        :type t: int
+        :param t: elapsed ticks, can be fractional for time based changes
+        :type t: float
         :return: speed
         :rtype: float
         """
@@ -55,8 +59,8 @@ class LinearChange(AbstractChange):
     def s(self, t):
         """Get distance based on elapsed time.
 
-        :param t: elapsed ticks
-        :type t: int
+        :param t: elapsed ticks, can be fractional for time based changes
+        :type t: float
         :return: distance
         :rtype: float
         """
@@ -82,8 +86,8 @@ class ParabolaChange(AbstractChange):
 
         Derivative from v(t).
 
-        :param t: elapsed ticks
-        :type t: int
+        :param t: elapsed ticks, can be fractional for time based changes
+        :type t: float
         :return: acceleration
         :rtype: float
         """
@@ -94,8 +98,8 @@ class ParabolaChange(AbstractChange):
 
         Derivative from s(t).
 
-        :param t: elapsed ticks
-        :type t: int
+        :param t: elapsed ticks, can be fractional for time based changes
+        :type t: float
         :return: speed
         :rtype: float
         """
@@ -104,8 +108,8 @@ class ParabolaChange(AbstractChange):
     def s(self, t):
         """Get distance based on elapsed time.
 
-        :param t: elapsed ticks
-        :type t: int
+        :param t: elapsed ticks, can be fractional for time based changes
+        :type t: float
         :return: distance
         :rtype: float
         """
@@ -131,8 +135,8 @@ class TrigChange(AbstractChange):
 
         Derivative from v(t).
 
-        :param t: elapsed ticks
-        :type t: int
+        :param t: elapsed ticks, can be fractional for time based changes
+        :type t: float
         :return: acceleration
         :rtype: float
         """
@@ -143,8 +147,8 @@ class TrigChange(AbstractChange):
 
         Derivative from s(t).
 
-        :param t: elapsed ticks
-        :type t: int
+        :param t: elapsed ticks, can be fractional for time based changes
+        :type t: float
         :return: speed
         :rtype: float
         """
@@ -153,8 +157,8 @@ class TrigChange(AbstractChange):
     def s(self, t):
         """Get distance based on elapsed time.
 
-        :param t: elapsed ticks
-        :type t: int
+        :param t: elapsed ticks, can be fractional for time based changes
+        :type t: float
         :return: distance
         :rtype: float
         """
@@ -183,8 +187,8 @@ class ExponentialChange(AbstractChange):
 
         Derivative from v(t).
 
-        :param t: elapsed ticks
-        :type t: int
+        :param t: elapsed ticks, can be fractional for time based changes
+        :type t: float
         :return: acceleration
         :rtype: float
         """
@@ -195,8 +199,8 @@ class ExponentialChange(AbstractChange):
 
         Derivative from s(t).
 
-        :param t: elapsed ticks
-        :type t: int
+        :param t: elapsed ticks, can be fractional for time based changes
+        :type t: float
         :return: speed
         :rtype: float
         """
@@ -205,9 +209,105 @@ class ExponentialChange(AbstractChange):
     def s(self, t):
         """Get distance based on elapsed time.
 
-        :param t: elapsed ticks
-        :type t: int
+        :param t: elapsed ticks, can be fractional for time based changes
+        :type t: float
         :return: distance
         :rtype: float
         """
         return self.__b * (self.__a**t - 1)
+
+
+class LookupChange(AbstractChange):
+    """A class to represent a change of which the values at whole ticks are looked up in precomputed tables.
+
+    The tables of a, v and s are computed once for every tick from 0 up to and including ticks, and are shared between
+    all LookupChange objects with the same change class, difference and ticks. Fractional ticks fall back to the
+    wrapped change.
+    """
+
+    max_cached = 256
+    _cache = dict()
+    _motion_classes = dict()
+
+    def __init__(self, change_class, difference, ticks):
+        """Initiate LookupChange object, inheriting from AbstractChange class.
+
+        :param change_class: class of the change to precompute
+        :type change_class: type
+        :param difference: total difference needed for calculation
+        :type difference: float
+        :param ticks: time it takes to get the total difference
+        :type ticks: int
+        """
+        key = (change_class, difference, ticks)
+        tables = LookupChange._cache.get(key)
+        if tables is None:
+            change = change_class(difference, ticks)
+            tables = (change,
+                      tuple(change.a(t) for t in range(ticks + 1)),
+                      tuple(change.v(t) for t in range(ticks + 1)),
+                      tuple(change.s(t) for t in range(ticks + 1)))
+            if len(LookupChange._cache) >= LookupChange.max_cached:
+                del LookupChange._cache[next(iter(LookupChange._cache))]
+            LookupChange._cache[key] = tables
+        self.__change, self.__a, self.__v, self.__s = tables
+
+    def a(self, t):
+        """Get acceleration based on elapsed time.
+
+        :param t: elapsed ticks, can be fractional for time based changes
+        :type t: float
+        :return: acceleration
+        :rtype: float
+        """
+        if type(t) is int and 0 <= t < len(self.__a):
+            return self.__a[t]
+        return self.__change.a(t)
+
+    def v(self, t):
+        """Get speed based on elapsed time.
+
+        :param t: elapsed ticks, can be fractional for time based changes
+        :type t: float
+        :return: speed
+        :rtype: float
+        """
+        if type(t) is int and 0 <= t < len(self.__v):
+            return self.__v[t]
+        return self.__change.v(t)
+
+    def s(self, t):
+        """Get distance based on elapsed time.
+
+        :param t: elapsed ticks, can be fractional for time based changes
+        :type t: float
+        :return: distance
+        :rtype: float
+        """
+        if type(t) is int and 0 <= t < len(self.__s):
+            return self.__s[t]
+        return self.__change.s(t)
+
+    @staticmethod
+    def of(change_class):
+        """Create a motion class for effects that looks up the values of change_class.
+
+        Usage: Move(shape, new_pos, ticks, LookupChange.of(TrigChange))
+
+        The same function is returned for every call with the same change_class, so effects using it can be grouped
+        into batches and share baked clips, which both compare motion classes.
+
+        :param change_class: class of the change to precompute
+        :type change_class: type
+        :return: function taking difference and ticks, returning a LookupChange
+        :rtype: function
+        """
+        motion_class = LookupChange._motion_classes.get(change_class)
+        if motion_class is None:
+            motion_class = LookupChange._motion_classes[change_class] = _partial(LookupChange, change_class)
+        return motion_class
+
+    @staticmethod
+    def clear_cache():
+        """Remove all shared tables."""
+        LookupChange._cache.clear()
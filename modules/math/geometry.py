@@ -7,11 +7,17 @@ from ..logic.layout import LayoutDefault as _LayoutDefault
 from ..logic.common import represent
 
 
-class Point:
-    """A class to represent a point with no visual representation in two-dimensional space."""
+class AbstractPoint:
+    """A class to contain the behavior shared by points and all shapes in two-dimensional space.
+
+    AbstractPoint has no instance layout of its own, so Point can be a compact slotted class while Box and its
+    subclasses keep a __dict__ and can still be combined with pygame.Surface and timers.
+    """
+
+    __slots__ = ()
 
     def __init__(self, x, y):
-        """Initiate Point object.
+        """Initiate AbstractPoint object.
 
         :type x: float
         :type y: float
@@ -83,6 +89,13 @@ class Point:
         """
         pass
 
+    def snapshot(self):
+        """Get a Point with the current x- and y-coordinate of self, for example to remember an original position.
+
+        :rtype: Point
+        """
+        return Point(self.x, self.y)
+
     def distance_to(self, point):
         """Calculate distance between self and given point.
 
@@ -210,6 +223,27 @@ class Point:
             return self.y
         raise IndexError
 
+    def __len__(self):
+        """Return dimension of self. Is always 2 for two-dimensional Point.
+
+        :return: dimension of self
+        :rtype: int
+        """
+        return 2
+
+    def __repr__(self):
+        """Return repr(self)."""
+        return represent("x y", self.x, self.y)
+
+
+class Point(AbstractPoint):
+    """A class to represent a point with no visual representation in two-dimensional space.
+
+    Point is slotted: it has no per-instance __dict__, which keeps polygon vertices, particles and snapshots small.
+    """
+
+    __slots__ = ("x", "y", "__index")
+
     def __iter__(self):
         """Initiate iteration sequence.
 
@@ -219,14 +253,6 @@ class Point:
         self.__index = 0
         return self
 
-    def __len__(self):
-        """Return dimension of self. Is always 2 for two-dimensional Point.
-
-        :return: dimension of self
-        :rtype: int
-        """
-        return 2
-
     def __next__(self):
         """Progress iteration sequence.
 
@@ -240,16 +266,12 @@ class Point:
             return self.y
         raise StopIteration
 
-    def __repr__(self):
-        """Return repr(self)."""
-        return represent("x y", self.x, self.y)
-
 
-class Box(Point):
+class Box(AbstractPoint):
     """A class to represent a rectangle with no visual representation in two-dimensional space."""
 
     def __init__(self, x, y, width, height):
-        Point.__init__(self, x, y)
+        AbstractPoint.__init__(self, x, y)
         self.width = width
         self.height = height
         self.x2 = self.x + self.width
@@ -268,7 +290,7 @@ class Box(Point):
 
         :type x: float
         """
-        Point.set_x(self, x)
+        AbstractPoint.set_x(self, x)
         self._update_x2()
 
     def set_y(self, y):
@@ -276,7 +298,7 @@ class Box(Point):
 
         :type y: float
         """
-        Point.set_y(self, y)
+        AbstractPoint.set_y(self, y)
         self._update_y2()
 
     def set_pos(self, x, y):
@@ -945,6 +967,13 @@ class Polygon(Rect):
     def get_points_avg(self):
         return Geometry.get_points_avg(self)
 
+    def snapshot_points(self):
+        """Get the current coordinates of all points, which can be restored with set_points.
+
+        :rtype: tuple of (float, float)
+        """
+        return tuple((point.x, point.y) for point in self.points)
+
     def rotate(self, angle):
         """Rotate all points around centre point a given amount of radians
 
@@ -0,0 +1,6 @@
+from .particle import *
+from .system import *
+from .emitter import *
+from .renderer import *
+from .collision import *
+from .parallel import *
@@ -0,0 +1,274 @@
+from ..math.geometry import Circle as _Circle, Polygon as _Polygon
+
+try:
+    import numpy as _np
+except ImportError:
+    _np = None
+
+# Offsets of the cells a cell is compared with, half of the neighbours so every pair of cells is compared once.
+_NEIGHBOURS = ((0, 0), (1, 0), (-1, 1), (0, 1), (1, 1))
+
+
+class ParticleCollider:
+    """A class to collide the particles of a ParticleSystem with each other and with static shapes.
+
+    Particles are treated as circles with a diameter of their size. For collisions between particles, a uniform grid
+    with cells at least as large as the largest particle is rebuilt every tick: particles are counted per cell and
+    sorted by cell with a stable radix sort, so the particles of every cell are next to each other. Only particles in
+    the same or neighbouring cells are compared. Overlapping particles are pushed apart and bounce off each other
+    with equal mass. Rect, Circle and Polygon shapes are collided with all particles at once per shape.
+    """
+
+    def __init__(self, shapes=None, particles=True, restitution=1, cell_size=None, iterations=1):
+        """Initiate ParticleCollider object.
+
+        :param shapes: static shapes particles bounce off
+        :type shapes: list of _Rect or None
+        :param particles: collide particles with each other
+        :type particles: bool
+        :param restitution: fraction of the speed along the normal that is kept in a bounce
+        :type restitution: float
+        :param cell_size: size of the grid cells, the size of the largest particle by default
+        :type cell_size: float or None
+        :param iterations: times particles are collided with each other per tick, more iterations let piles of
+            particles overlap less
+        :type iterations: int
+        """
+        if _np is None:
+            raise ImportError("Error: particle collisions require numpy")
+        self.shapes = list() if shapes is None else list(shapes)
+        self.particles = particles
+        self.restitution = restitution
+        self.cell_size = cell_size
+        self.iterations = iterations
+
+    def add_shape(self, shape):
+        """Add static shape particles bounce off.
+
+        :type shape: _Rect
+        """
+        self.shapes.append(shape)
+
+    def remove_shape(self, shape):
+        """Remove static shape.
+
+        :type shape: _Rect
+        """
+        self.shapes.remove(shape)
+
+    def update(self, system):
+        """Collide all living particles of a system with each other and with all shapes.
+
+        :type system: ParticleSystem
+        """
+        indices = system.living()
+        if len(indices) == 0:
+            return
+        if self.particles:
+            for _ in range(self.iterations):
+                self.collide_particles(system, indices)
+        for shape in self.shapes:
+            self.collide_shape(system, indices, shape)
+
+    @staticmethod
+    def _centres(system, indices):
+        """Get the radius and the centre of particles.
+
+        :type system: ParticleSystem
+        :type indices: _np.ndarray
+        :rtype: (_np.ndarray, _np.ndarray, _np.ndarray)
+        """
+        radius = system.sizes[indices] / 2
+        return radius, system.x[indices] + radius, system.y[indices] + radius
+
+    def grid(self, cx, cy, cell_size):
+        """Sort positions into a uniform grid.
+
+        :type cx: _np.ndarray
+        :type cy: _np.ndarray
+        :type cell_size: float
+        :return: cell column and row per position, amount of columns, amount of particles per cell, index of the first
+            particle of every cell in order, and the positions sorted by cell
+        :rtype: (_np.ndarray, _np.ndarray, int, _np.ndarray, _np.ndarray, _np.ndarray)
+        """
+        # Cells are made larger when the particles are spread so far that there would be many more cells than particles.
+        area = (cx.max() - cx.min() + 1) * (cy.max() - cy.min() + 1)
+        cell_size = max(cell_size, (area / (4 * len(cx))) ** 0.5)
+        column = ((cx - cx.min()) // cell_size).astype(_np.intp)
+        row = ((cy - cy.min()) // cell_size).astype(_np.intp)
+        columns = int(column.max()) + 1
+        cells = row * columns + column
+        amount = columns * (int(row.max()) + 1)
+
+        counts = _np.bincount(cells, minlength=amount)
+        starts = _np.cumsum(counts) - counts
+        keys = cells.astype(_np.uint16) if amount <= 1 << 16 else cells
+        order = _np.argsort(keys, kind="stable")
+        return column, row, columns, counts, starts, order
+
+    def pairs(self, cx, cy, cell_size):
+        """Get all pairs of positions in the same or neighbouring cells of a uniform grid.
+
+        :type cx: _np.ndarray
+        :type cy: _np.ndarray
+        :type cell_size: float
+        :return: first and second index of every pair
+        :rtype: (_np.ndarray, _np.ndarray)
+        """
+        column, row, columns, counts, starts, order = self.grid(cx, cy, cell_size)
+        rows = len(counts) // columns
+        column, row = column[order], row[order]
+        first, second = list(), list()
+        for dx, dy in _NEIGHBOURS:
+            neighbour_column = column + dx
+            neighbour_row = row + dy
+            valid = _np.flatnonzero((neighbour_column >= 0) & (neighbour_column < columns) & (neighbour_row < rows))
+            cells = neighbour_row[valid] * columns + neighbour_column[valid]
+            amounts = counts[cells]
+            total = int(amounts.sum())
+            if total == 0:
+                continue
+            i = _np.repeat(valid, amounts)
+            j = _np.repeat(starts[cells] - (_np.cumsum(amounts) - amounts), amounts) + _np.arange(total)
+            if dx == 0 and dy == 0:
+                keep = j > i
+                i, j = i[keep], j[keep]
+            first.append(order[i])
+            second.append(order[j])
+        if len(first) == 0:
+            return _np.zeros(0, dtype=_np.intp), _np.zeros(0, dtype=_np.intp)
+        return _np.concatenate(first), _np.concatenate(second)
+
+    def collide_particles(self, system, indices):
+        """Push overlapping particles apart and let them bounce off each other with equal mass.
+
+        :type system: ParticleSystem
+        :param indices: indices of the particles to collide
+        :type indices: _np.ndarray
+        """
+        radius, cx, cy = self._centres(system, indices)
+        cell_size = self.cell_size if self.cell_size is not None else max(float(radius.max()) * 2, 1)
+        i, j = self.pairs(cx, cy, cell_size)
+        dx = cx[j] - cx[i]
+        dy = cy[j] - cy[i]
+        distance = _np.hypot(dx, dy)
+        hit = distance < radius[i] + radius[j]
+        i, j, dx, dy, distance = i[hit], j[hit], dx[hit], dy[hit], distance[hit]
+        if len(i) == 0:
+            return
+
+        apart = distance > 0
+        nx = _np.where(apart, dx / _np.where(apart, distance, 1), 1)
+        ny = _np.where(apart, dy / _np.where(apart, distance, 1), 0)
+        push = (radius[i] + radius[j] - distance) / 2
+        normal_speed = ((system.dx[indices[j]] - system.dx[indices[i]]) * nx +
+                        (system.dy[indices[j]] - system.dy[indices[i]]) * ny)
+        impulse = _np.where(normal_speed < 0, -(1 + self.restitution) * normal_speed / 2, 0)
+
+        # Changes are summed per particle with bincount, as a particle can be in many pairs.
+        n = len(indices)
+        for array, change in ((system.x, nx * push), (system.y, ny * push), (system.dx, nx * impulse),
+                              (system.dy, ny * impulse)):
+            array[indices] += _np.bincount(j, change, n) - _np.bincount(i, change, n)
+
+    def collide_shape(self, system, indices, shape):
+        """Push particles out of a static shape and let them bounce off it.
+
+        :type system: ParticleSystem
+        :param indices: indices of the particles to collide
+        :type indices: _np.ndarray
+        :type shape: _Rect
+        """
+        radius, cx, cy = self._centres(system, indices)
+        near = _np.flatnonzero((cx + radius > shape.x) & (cx - radius < shape.x + shape.width) &
+                               (cy + radius > shape.y) & (cy - radius < shape.y + shape.height))
+        if len(near) == 0:
+            return
+        radius, cx, cy, indices = radius[near], cx[near], cy[near], indices[near]
+
+        if isinstance(shape, _Circle):
+            nx, ny, push = self._circle(shape, radius, cx, cy)
+        elif isinstance(shape, _Polygon):
+            nx, ny, push = self._polygon(shape, radius, cx, cy)
+        else:
+            nx, ny, push = self._rect(shape, radius, cx, cy)
+
+        hit = push > 0
+        indices, nx, ny, push = indices[hit], nx[hit], ny[hit], push[hit]
+        system.x[indices] += nx * push
+        system.y[indices] += ny * push
+        normal_speed = system.dx[indices] * nx + system.dy[indices] * ny
+        bounce = _np.where(normal_speed < 0, (1 + self.restitution) * normal_speed, 0)
+        system.dx[indices] -= bounce * nx
+        system.dy[indices] -= bounce * ny
+
+    @staticmethod
+    def _normals(dx, dy, distance):
+        """Normalize vectors, vectors of length 0 point up.
+
+        :rtype: (_np.ndarray, _np.ndarray)
+        """
+        apart = distance > 0
+        safe = _np.where(apart, distance, 1)
+        return _np.where(apart, dx / safe, 0), _np.where(apart, dy / safe, -1)
+
+    def _circle(self, shape, radius, cx, cy):
+        """Get outward normal and penetration depth of particles in a Circle.
+
+        :rtype: (_np.ndarray, _np.ndarray, _np.ndarray)
+        """
+        dx = cx - (shape.x + shape.radius)
+        dy = cy - (shape.y + shape.radius)
+        distance = _np.hypot(dx, dy)
+        nx, ny = self._normals(dx, dy, distance)
+        return nx, ny, radius + shape.radius - distance
+
+    def _rect(self, shape, radius, cx, cy):
+        """Get outward normal and penetration depth of particles in a Rect.
+
+        :rtype: (_np.ndarray, _np.ndarray, _np.ndarray)
+        """
+        x1, y1, x2, y2 = shape.x, shape.y, shape.x + shape.width, shape.y + shape.height
+        dx = cx - _np.clip(cx, x1, x2)
+        dy = cy - _np.clip(cy, y1, y2)
+        distance = _np.hypot(dx, dy)
+        nx, ny = self._normals(dx, dy, distance)
+        push = radius - distance
+
+        # Particles with their centre inside the rect are pushed out through the nearest side.
+        inside = distance == 0
+        depths = _np.stack((cx - x1, x2 - cx, cy - y1, y2 - cy))[:, inside]
+        side = _np.argmin(depths, axis=0)
+        nx[inside] = _np.array((-1, 1, 0, 0))[side]
+        ny[inside] = _np.array((0, 0, -1, 1))[side]
+        push[inside] = radius[inside] + depths[side, _np.arange(len(side))]
+        return nx, ny, push
+
+    def _polygon(self, shape, radius, cx, cy):
+        """Get outward normal and penetration depth of particles in a Polygon.
+
+        :rtype: (_np.ndarray, _np.ndarray, _np.ndarray)
+        """
+        points = _np.array(shape.snapshot_points(), dtype=float)
+        closest_x = _np.zeros_like(cx)
+        closest_y = _np.zeros_like(cy)
+        closest = _np.full_like(cx, _np.inf)
+        inside = _np.zeros(len(cx), dtype=bool)
+        for (x1, y1), (x2, y2) in zip(points, _np.roll(points, -1, axis=0)):
+            ex, ey = x2 - x1, y2 - y1
+            t = _np.clip(((cx - x1) * ex + (cy - y1) * ey) / max(ex * ex + ey * ey, 1e-12), 0, 1)
+            qx, qy = x1 + t * ex, y1 + t * ey
+            distance = _np.hypot(cx - qx, cy - qy)
+            nearer = distance < closest
+            closest = _np.where(nearer, distance, closest)
+            closest_x = _np.where(nearer, qx, closest_x)
+            closest_y = _np.where(nearer, qy, closest_y)
+            # Even-odd rule, like Collision.polygon_point.
+            crosses = (_np.minimum(y1, y2) <= cy) & (cy < _np.maximum(y1, y2))
+            if y1 != y2:
+                inside ^= crosses & (x1 + (cy - y1) * ex / ey > cx)
+
+        nx, ny = self._normals(cx - closest_x, cy - closest_y, closest)
+        nx = _np.where(inside, -nx, nx)
+        ny = _np.where(inside, -ny, ny)
+        return nx, ny, _np.where(inside, radius + closest, radius - closest)
@@ -0,0 +1,148 @@
+from math import pi as _pi
+from pygame import Color as _Color
+
+try:
+    import numpy as _np
+except ImportError:
+    _np = None
+
+
+class Emitter:
+    """A class to represent a source that emits particles into a ParticleSystem at a rate and in bursts.
+
+    Every value of new particles can be a single value or a (low, high) range, from which every particle gets a
+    uniformly random value. The speed can also be drawn from a normal distribution, then (mean, deviation) is given.
+    Particles are emitted in a direction within spread radians around angle.
+    """
+
+    def __init__(self, x, y, rate=0, angle=0, spread=2 * _pi, speed=(1, 2), lifetime=(30, 60), size=5,
+                 color=(0, 0, 0), ax=0, ay=0, width=0, height=0, distribution="uniform", seed=None):
+        """Initiate Emitter object.
+
+        :param x: x-coordinate of the emitting area
+        :type x: float
+        :param y: y-coordinate of the emitting area
+        :type y: float
+        :param rate: particles emitted per tick, can be fractional
+        :type rate: float
+        :param angle: direction in radians particles are emitted in
+        :type angle: float
+        :param spread: radians around angle particles are emitted within
+        :type spread: float
+        :param speed: speed of new particles
+        :type speed: float or (float, float)
+        :param lifetime: ticks until new particles die
+        :type lifetime: float or (float, float)
+        :type size: float or (float, float)
+        :param color: color of new particles, or colors of which every particle gets a random one
+        :type color: pygame.Color or tuple of int or list of pygame.Color
+        :type ax: float or (float, float)
+        :type ay: float or (float, float)
+        :param width: width of the emitting area, 0 to emit from a point
+        :type width: float
+        :param height: height of the emitting area, 0 to emit from a point
+        :type height: float
+        :param distribution: distribution of the speed, "uniform" or "normal"
+        :type distribution: str
+        :param seed: seed of the random generator, to emit the same particles every run
+        :type seed: int or None
+        """
+        if _np is None:
+            raise ImportError("Error: particle emitters require numpy")
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.rate = rate
+        self.angle = angle
+        self.spread = spread
+        self.speed = speed
+        self.lifetime = lifetime
+        self.size = size
+        self.color = color
+        self.ax = ax
+        self.ay = ay
+        self.distribution = distribution
+        self.active = True
+        self._random = _np.random.default_rng(seed)
+        self._accumulated = 0
+        self._burst = 0
+
+    def set_pos(self, x, y):
+        """Set x- and y-coordinate of the emitting area.
+
+        :type x: float
+        :type y: float
+        """
+        self.x = x
+        self.y = y
+
+    def set_rate(self, rate):
+        """Set rate to a certain value.
+
+        :type rate: float
+        """
+        self.rate = rate
+
+    def start(self):
+        """Start emitting at rate."""
+        self.active = True
+
+    def stop(self):
+        """Stop emitting at rate, bursts are still emitted."""
+        self.active = False
+
+    def burst(self, amount):
+        """Emit an amount of particles at once, during the next emit.
+
+        :type amount: int
+        """
+        self._burst += amount
+
+    def _sample(self, value, amount):
+        """Get amount values, all equal to value or uniformly random within a (low, high) range.
+
+        :type value: float or (float, float)
+        :type amount: int
+        :rtype: float or _np.ndarray
+        """
+        if isinstance(value, (tuple, list)):
+            return self._random.uniform(value[0], value[1], amount)
+        return value
+
+    def _colors(self, amount):
+        """Get the colors of amount new particles.
+
+        :type amount: int
+        :rtype: pygame.Color or tuple of int or _np.ndarray
+        """
+        if isinstance(self.color, list):
+            colors = _np.array(list(tuple(_Color(color)) for color in self.color), dtype=_np.uint8)
+            return colors[self._random.integers(0, len(colors), amount)]
+        return self.color
+
+    def emit(self, system):
+        """Emit the particles of this tick and of requested bursts into a particle system.
+
+        :type system: ParticleSystem
+        :return: amount of particles emitted
+        :rtype: int
+        """
+        if self.active:
+            self._accumulated += self.rate
+        amount = int(self._accumulated) + self._burst
+        self._accumulated -= int(self._accumulated)
+        self._burst = 0
+        if amount <= 0:
+            return 0
+
+        angles = self._random.uniform(self.angle - self.spread / 2, self.angle + self.spread / 2, amount)
+        if self.distribution == "normal" and isinstance(self.speed, (tuple, list)):
+            speeds = _np.abs(self._random.normal(self.speed[0], self.speed[1], amount))
+        else:
+            speeds = self._sample(self.speed, amount)
+        x = self.x + self._random.uniform(0, self.width, amount) if self.width else self.x
+        y = self.y + self._random.uniform(0, self.height, amount) if self.height else self.y
+        return system.add(x, y, _np.cos(angles) * speeds, _np.sin(angles) * speeds, self._sample(self.ax, amount),
+                          self._sample(self.ay, amount), self._colors(amount), self._sample(self.size, amount),
+                          self._sample(self.lifetime, amount))
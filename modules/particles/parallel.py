@@ -0,0 +1,150 @@
+from atexit import register as _register, unregister as _unregister
+from os import cpu_count as _cpu_count
+from types import SimpleNamespace as _SimpleNamespace
+
+from .system import _move_range, _bounce_range
+
+try:
+    import numpy as _np
+except ImportError:
+    _np = None
+
+try:
+    from multiprocessing import Pool as _Pool
+    from multiprocessing.shared_memory import SharedMemory as _SharedMemory
+except ImportError:
+    _Pool = None
+    _SharedMemory = None
+
+_SHARED = ("x", "y", "dx", "dy", "ax", "ay", "sizes")
+
+_worker_arrays = None
+_worker_memory = list()
+
+
+def _attach_worker(names, capacity):
+    """Attach a worker process to the shared arrays of a particle system.
+
+    :param names: name of the shared memory block per array
+    :type names: dict
+    :type capacity: int
+    """
+    global _worker_arrays
+    _worker_arrays = _SimpleNamespace()
+    for attribute, name in names.items():
+        memory = _SharedMemory(name=name)
+        _worker_memory.append(memory)
+        setattr(_worker_arrays, attribute, _np.ndarray(capacity, dtype=float, buffer=memory.buf))
+
+
+def _step_worker(start, end, drag, bounds):
+    """Move and bounce the particles in a range of indices of the shared arrays.
+
+    :type start: int
+    :type end: int
+    :type drag: float
+    :type bounds: (float, float, float, float) or None
+    """
+    _move_range(_worker_arrays, start, end, drag)
+    if bounds is not None:
+        _bounce_range(_worker_arrays, start, end, *bounds)
+
+
+class ParallelStepper:
+    """A class to move and bounce the particles of a ParticleSystem in a pool of worker processes.
+
+    The position, velocity, acceleration and size arrays of the system are moved into shared memory. Every step, the
+    particles are split into one contiguous range per process, and every process moves and bounces its own range in
+    place. Every particle is changed by the same operations as in ParticleSystem.update_move and update_in_box, so the
+    results are exactly equal to stepping in one process. Emitting, colliding and aging stay in the main process.
+
+    When shared memory or worker processes are not available, or the system has less particles than threshold, the
+    ranges are stepped in the main process instead. The shared memory and processes are released by close, which is
+    called when the stepper is used as a context manager and at exit otherwise.
+    """
+
+    def __init__(self, processes=None, threshold=20000):
+        """Initiate ParallelStepper object.
+
+        :param processes: amount of worker processes, the amount of CPUs by default
+        :type processes: int or None
+        :param threshold: least amount of particles to step in the worker processes
+        :type threshold: int
+        """
+        self.processes = (_cpu_count() or 1) if processes is None else processes
+        self.threshold = threshold
+        self.system = None
+        self._memory = dict()
+        self._pool = None
+
+    def attach(self, system):
+        """Move the arrays of a system into shared memory and start the worker processes.
+
+        :type system: ParticleSystem
+        """
+        self.close()
+        self.system = system
+        if _Pool is None or self.processes < 2:
+            return
+        _register(self.close)
+        try:
+            for attribute in _SHARED:
+                array = getattr(system, attribute)
+                memory = _SharedMemory(create=True, size=array.nbytes)
+                shared = _np.ndarray(array.shape, dtype=array.dtype, buffer=memory.buf)
+                shared[:] = array
+                setattr(system, attribute, shared)
+                self._memory[attribute] = memory
+            names = dict((attribute, memory.name) for attribute, memory in self._memory.items())
+            self._pool = _Pool(self.processes, _attach_worker, (names, system.capacity))
+        except (OSError, ValueError) as error:
+            print("Warning: worker processes are not available ({}). Stepping in one process.".format(error))
+            self.close()
+            self.system = system
+
+    def ranges(self, end):
+        """Split the indices up to end into one contiguous range per process.
+
+        :type end: int
+        :rtype: list of (int, int)
+        """
+        bounds = _np.linspace(0, end, self.processes + 1).astype(int).tolist()
+        return list((start, stop) for start, stop in zip(bounds, bounds[1:]) if start < stop)
+
+    def step(self, system):
+        """Move and bounce all particles of a system, attaching to it first if needed.
+
+        :type system: ParticleSystem
+        """
+        if system is not self.system:
+            self.attach(system)
+        ranges = self.ranges(system.end)
+        if self._pool is not None and system.end >= self.threshold:
+            self._pool.starmap(_step_worker, list((start, end, system.drag, system.bounds) for start, end in ranges))
+            return
+        for start, end in ranges:
+            _move_range(system, start, end, system.drag)
+            if system.bounds is not None:
+                _bounce_range(system, start, end, *system.bounds)
+
+    def close(self):
+        """Stop the worker processes and move the arrays of the system back out of shared memory."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+        for attribute, memory in self._memory.items():
+            setattr(self.system, attribute, _np.array(getattr(self.system, attribute)))
+            memory.close()
+            memory.unlink()
+        self._memory.clear()
+        self.system = None
+        _unregister(self.close)
+
+    def __enter__(self):
+        """Return self, close is called when the with statement ends."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Stop the worker processes and release the shared memory."""
+        self.close()
@@ -1,8 +1,10 @@
-from .math.geometry import Point as _Point
+from ..math.geometry import Point as _Point
 from pygame import draw as _draw, Color as _Color
 
 
 class Particle(_Point):
+    __slots__ = ("dx", "dy", "ax", "ay", "color", "size")
+
     def __init__(self, x, y, dx=0, dy=0, ax=0, ay=0, color=_Color(0, 0, 0), size=5):
         _Point.__init__(self, x, y)
         self.dx = dx
@@ -65,3 +67,8 @@ class Particle(_Point):
 
     def draw(self, surface):
         _draw.rect(surface, self.color, (self.x, self.y, self.size, self.size))
+
+    def draw_interpolated(self, surface, alpha):
+        x = self.x - self.dx * (1 - alpha)
+        y = self.y - self.dy * (1 - alpha)
+        _draw.rect(surface, self.color, (x, y, self.size, self.size))
@@ -0,0 +1,119 @@
+from pygame import Surface as _Surface, SRCALPHA as _SRCALPHA, display as _display, surfarray as _surfarray
+
+try:
+    import numpy as _np
+except ImportError:
+    _np = None
+
+
+class ParticleRenderer:
+    """A class to draw the particles of a ParticleSystem with one Surface.blits call.
+
+    Particles are grouped by their size and their color rounded to one of buckets levels per channel. One square sprite
+    is rendered per group, the first time the group is drawn, and kept for later frames. Particles of 1 pixel can be
+    written straight into the pixels of the surface instead, which is faster but ignores the alpha of the color.
+    """
+
+    def __init__(self, buckets=8, pixel_path=True, max_cached=4096):
+        """Initiate ParticleRenderer object.
+
+        :param buckets: amount of levels per color channel, more levels give more accurate colors and more sprites
+        :type buckets: int
+        :param pixel_path: write particles of 1 pixel into the pixels of the surface
+        :type pixel_path: bool
+        :param max_cached: amount of sprites after which all sprites are rendered again
+        :type max_cached: int
+        """
+        if _np is None:
+            raise ImportError("Error: particle renderers require numpy")
+        self.buckets = buckets
+        self.pixel_path = pixel_path
+        self.max_cached = max_cached
+        self._sprites = dict()
+
+    def _sprite(self, key):
+        """Get the sprite of a key, render it when it is not cached.
+
+        :param key: size and color buckets combined into one integer
+        :type key: int
+        :rtype: _Surface
+        """
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            colors, size = divmod(key, 1 << 16)
+            channels = list()
+            for _ in range(4):
+                colors, bucket = divmod(colors, self.buckets)
+                channels.append(bucket * 255 // (self.buckets - 1))
+            a, b, g, r = channels
+            sprite = _Surface((size, size), _SRCALPHA)
+            sprite.fill((r, g, b, a))
+            if _display.get_surface() is not None:
+                sprite = sprite.convert() if a == 255 else sprite.convert_alpha()
+            if len(self._sprites) >= self.max_cached:
+                self._sprites.clear()
+            self._sprites[key] = sprite
+        return sprite
+
+    def _key_colors(self, colors):
+        """Combine the color buckets of RGBA colors into one integer per color.
+
+        :type colors: _np.ndarray
+        :rtype: _np.ndarray
+        """
+        buckets = (colors.astype(_np.int64) * (self.buckets - 1) + 127) // 255
+        return ((buckets[:, 0] * self.buckets + buckets[:, 1]) * self.buckets + buckets[:, 2]) * self.buckets + \
+            buckets[:, 3]
+
+    def draw_pixels(self, surface, x, y, colors):
+        """Write particles of 1 pixel into the pixels of a surface, ignoring alpha.
+
+        :type surface: _Surface
+        :type x: _np.ndarray
+        :type y: _np.ndarray
+        :type colors: _np.ndarray
+        :return: False when the surface doesn't support direct pixel access
+        :rtype: bool
+        """
+        if surface.get_bytesize() < 3:
+            return False
+        x = x.astype(_np.intp)
+        y = y.astype(_np.intp)
+        width, height = surface.get_size()
+        inside = (x >= 0) & (x < width) & (y >= 0) & (y < height)
+        pixels = _surfarray.pixels3d(surface)
+        pixels[x[inside], y[inside]] = colors[inside, :3]
+        del pixels
+        return True
+
+    def draw(self, system, surface, alpha=1):
+        """Draw all living particles of a system.
+
+        :type system: ParticleSystem
+        :type surface: _Surface
+        :param alpha: fraction between previous and current position of the particles
+        :type alpha: float
+        """
+        indices = system.living()
+        x = system.x[indices] - system.dx[indices] * (1 - alpha)
+        y = system.y[indices] - system.dy[indices] * (1 - alpha)
+        sizes = _np.clip(_np.rint(system.sizes[indices]), 0, (1 << 16) - 1).astype(_np.int64)
+        colors = system.colors[indices]
+
+        if self.pixel_path:
+            pixels = sizes == 1
+            if pixels.any() and self.draw_pixels(surface, x[pixels], y[pixels], colors[pixels]):
+                visible = ~pixels & (sizes > 0)
+            else:
+                visible = sizes > 0
+        else:
+            visible = sizes > 0
+        x, y, sizes, colors = x[visible], y[visible], sizes[visible], colors[visible]
+        if len(sizes) == 0:
+            return
+
+        keys, inverse = _np.unique(sizes + (self._key_colors(colors) << 16), return_inverse=True)
+        sprites = _np.empty(len(keys), dtype=object)
+        sprites[:] = list(self._sprite(key) for key in keys.tolist())
+        positions = _np.stack((x, y), axis=1).astype(_np.int32)
+        surface.blits(zip(sprites[inverse].tolist(), positions.tolist()), False)
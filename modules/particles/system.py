@@ -0,0 +1,325 @@
+from math import inf as _inf
+from pygame import Color as _Color
+
+from ..logic.common import represent
+from .renderer import ParticleRenderer as _ParticleRenderer
+
+try:
+    import numpy as _np
+except ImportError:
+    _np = None
+
+
+def _move_range(arrays, start, end, drag):
+    """Accelerate, apply drag to and move the particles in a range of indices.
+
+    :param arrays: object with the x, y, dx, dy, ax and ay arrays of a particle system
+    :type start: int
+    :type end: int
+    :type drag: float
+    """
+    arrays.dx[start:end] += arrays.ax[start:end]
+    arrays.dy[start:end] += arrays.ay[start:end]
+    if drag != 1:
+        arrays.dx[start:end] *= drag
+        arrays.dy[start:end] *= drag
+    arrays.x[start:end] += arrays.dx[start:end]
+    arrays.y[start:end] += arrays.dy[start:end]
+
+
+def _bounce_range(arrays, start, end, x1, y1, x2, y2):
+    """Bounce the particles in a range of indices off the edges of a box.
+
+    :param arrays: object with the x, y, dx, dy and sizes arrays of a particle system
+    :type start: int
+    :type end: int
+    """
+    size = arrays.sizes[start:end]
+    for position, velocity, low, high in ((arrays.x[start:end], arrays.dx[start:end], x1, x2),
+                                          (arrays.y[start:end], arrays.dy[start:end], y1, y2)):
+        below = position <= low
+        above = ~below & (position + size >= high)
+        velocity[below | above] *= -1
+        position[below] = low
+        position[above] = high - size[above]
+
+
+class ParticleSystem:
+    """A class to represent a large amount of particles stored as a structure of numpy arrays.
+
+    Instead of one Particle object per particle, positions, velocities, accelerations, colors, sizes, ages and
+    lifetimes are stored in one array each, which form a pool of fixed capacity. The indices of dead particles are kept
+    on a free-list and are recycled in place by new particles, so a running system allocates no memory. Moving,
+    bouncing, aging and the size and color over lifetime curves are each one vectorized step over the first end
+    elements, the alive mask tells which of those are in use. Emitters added to the system emit before every step.
+    A ParticleSystem can be added to a Page like any shape.
+    """
+
+    def __init__(self, capacity=100000, drag=1, bounds=None, renderer=None, collider=None):
+        """Initiate ParticleSystem object.
+
+        :param capacity: maximum amount of particles
+        :type capacity: int
+        :param drag: factor velocities are multiplied with every tick
+        :type drag: float
+        :param bounds: box x1, y1, x2, y2 particles bounce within, or None
+        :type bounds: (float, float, float, float) or None
+        :param renderer: renderer to draw particles with, a ParticleRenderer by default
+        :type renderer: _ParticleRenderer or None
+        :param collider: collider to collide particles with each other and with shapes after moving, or None
+        :type collider: ParticleCollider or None
+        """
+        if _np is None:
+            raise ImportError("Error: particle systems require numpy")
+        self.capacity = capacity
+        self.count = 0
+        self.end = 0
+        self.drag = drag
+        self.bounds = bounds
+        self.emitters = list()
+        self.renderer = _ParticleRenderer() if renderer is None else renderer
+        self.collider = collider
+        self.stepper = None
+        self.size_curve = None
+        self.color_curve = None
+        self.alive = _np.zeros(capacity, dtype=bool)
+        self._free = _np.zeros(capacity, dtype=_np.intp)
+        self._free_count = 0
+        self.x = _np.zeros(capacity)
+        self.y = _np.zeros(capacity)
+        self.dx = _np.zeros(capacity)
+        self.dy = _np.zeros(capacity)
+        self.ax = _np.zeros(capacity)
+        self.ay = _np.zeros(capacity)
+        self.colors = _np.zeros((capacity, 4), dtype=_np.uint8)
+        self.sizes = _np.zeros(capacity)
+        self.base_sizes = _np.zeros(capacity)
+        self.ages = _np.zeros(capacity)
+        self.lifetimes = _np.zeros(capacity)
+
+    def set_drag(self, drag):
+        """Set drag to a certain value.
+
+        :type drag: float
+        """
+        self.drag = drag
+
+    def set_bounds(self, bounds):
+        """Set box particles bounce within.
+
+        :type bounds: (float, float, float, float) or None
+        """
+        self.bounds = bounds
+
+    def set_collider(self, collider):
+        """Set collider to collide particles with each other and with shapes after moving.
+
+        :type collider: ParticleCollider or None
+        """
+        self.collider = collider
+
+    def set_stepper(self, stepper):
+        """Set stepper to move and bounce particles in other processes, or None to move them in this process.
+
+        :type stepper: ParallelStepper or None
+        """
+        self.stepper = stepper
+
+    def set_size_curve(self, factors):
+        """Set the factors particle sizes are multiplied with over their lifetime, evenly spread from birth to death.
+
+        :param factors: at least 2 factors, or None to keep sizes constant
+        :type factors: list of float or None
+        """
+        self.size_curve = None if factors is None else _np.array(factors, dtype=float)
+
+    def set_color_curve(self, colors):
+        """Set the colors particles fade through over their lifetime, evenly spread from birth to death.
+
+        :param colors: at least 2 colors, or None to keep the colors particles are added with
+        :type colors: list of pygame.Color or list of tuple of int or None
+        """
+        if colors is None:
+            self.color_curve = None
+        else:
+            self.color_curve = _np.array(list(tuple(_Color(color)) for color in colors), dtype=float)
+
+    def add_emitter(self, emitter):
+        """Add emitter that emits particles into self before every step.
+
+        :type emitter: Emitter
+        """
+        self.emitters.append(emitter)
+
+    def remove_emitter(self, emitter):
+        """Remove emitter.
+
+        :type emitter: Emitter
+        """
+        self.emitters.remove(emitter)
+
+    @staticmethod
+    def _colors(color, amount):
+        """Convert one color or an array of colors to an array of amount RGBA colors.
+
+        :type color: pygame.Color or tuple of int or _np.ndarray
+        :type amount: int
+        :rtype: _np.ndarray
+        """
+        colors = _np.asarray(tuple(color) if not isinstance(color, _np.ndarray) else color, dtype=_np.uint8)
+        if colors.ndim == 1:
+            colors = _np.tile(colors, (amount, 1))
+        if colors.shape[1] == 3:
+            colors = _np.concatenate((colors, _np.full((amount, 1), 255, dtype=_np.uint8)), axis=1)
+        return colors
+
+    def add(self, x, y, dx=0, dy=0, ax=0, ay=0, color=(0, 0, 0), size=5, lifetime=_inf):
+        """Add particles, every value can be one value for all particles or an array with one value per particle.
+
+        Particles that don't fit within the capacity are not added.
+
+        :type x: float or _np.ndarray
+        :type y: float or _np.ndarray
+        :type dx: float or _np.ndarray
+        :type dy: float or _np.ndarray
+        :type ax: float or _np.ndarray
+        :type ay: float or _np.ndarray
+        :type color: pygame.Color or tuple of int or _np.ndarray
+        :type size: float or _np.ndarray
+        :param lifetime: ticks until the particles die
+        :type lifetime: float or _np.ndarray
+        :return: amount of particles added
+        :rtype: int
+        """
+        values = _np.broadcast_arrays(*(_np.atleast_1d(value) for value in (x, y, dx, dy, ax, ay, size, lifetime)))
+        indices = self._allocate(len(values[0]))
+        amount = len(indices)
+        for array, value in zip((self.x, self.y, self.dx, self.dy, self.ax, self.ay, self.base_sizes,
+                                 self.lifetimes), values):
+            array[indices] = value[:amount]
+        self.sizes[indices] = self.base_sizes[indices]
+        self.ages[indices] = 0
+        self.colors[indices] = self._colors(color, len(values[0]))[:amount]
+        self.alive[indices] = True
+        return amount
+
+    def _allocate(self, amount):
+        """Take indices for new particles, first from the free-list and then after the end.
+
+        :type amount: int
+        :return: indices of at most amount new particles, less when the pool is full
+        :rtype: _np.ndarray
+        """
+        amount = min(amount, self._free_count + self.capacity - self.end)
+        recycled = min(amount, self._free_count)
+        self._free_count -= recycled
+        indices = _np.concatenate((self._free[self._free_count:self._free_count + recycled],
+                                   _np.arange(self.end, self.end + amount - recycled)))
+        self.end += amount - recycled
+        self.count += amount
+        return indices
+
+    def kill(self, indices):
+        """Kill particles and put their indices on the free-list.
+
+        :param indices: indices of living particles
+        :type indices: _np.ndarray
+        """
+        self.alive[indices] = False
+        self._free[self._free_count:self._free_count + len(indices)] = indices
+        self._free_count += len(indices)
+        self.count -= len(indices)
+        if self.count == 0:
+            self.end = 0
+            self._free_count = 0
+
+    def living(self):
+        """Get the indices of all living particles.
+
+        :rtype: _np.ndarray
+        """
+        return _np.flatnonzero(self.alive[:self.end])
+
+    def clear(self):
+        """Remove all particles."""
+        self.alive[:] = False
+        self.count = 0
+        self.end = 0
+        self._free_count = 0
+
+    def update_move(self, drag=1):
+        """Accelerate, apply drag to and move all particles.
+
+        :param drag: factor velocities are multiplied with
+        :type drag: float
+        """
+        _move_range(self, 0, self.end, drag)
+
+    def update_in_box(self, x1, y1, x2, y2):
+        """Bounce all particles off the edges of a box, like Particle.update_in_box.
+
+        :type x1: float
+        :type y1: float
+        :type x2: float
+        :type y2: float
+        """
+        _bounce_range(self, 0, self.end, x1, y1, x2, y2)
+
+    def update_lifetime(self):
+        """Age all particles one tick, kill the particles that reached their lifetime and apply the curves."""
+        n = self.end
+        self.ages[:n] += 1
+        dead = _np.flatnonzero(self.alive[:n] & (self.ages[:n] >= self.lifetimes[:n]))
+        if len(dead) > 0:
+            self.kill(dead)
+
+        if self.size_curve is None and self.color_curve is None:
+            return
+        n = self.end
+        with _np.errstate(divide="ignore", invalid="ignore"):
+            t = _np.nan_to_num(self.ages[:n] / self.lifetimes[:n])
+        if self.size_curve is not None:
+            stops = _np.linspace(0, 1, len(self.size_curve))
+            self.sizes[:n] = self.base_sizes[:n] * _np.interp(t, stops, self.size_curve)
+        if self.color_curve is not None:
+            stops = _np.linspace(0, 1, len(self.color_curve))
+            for channel in range(4):
+                self.colors[:n, channel] = _np.interp(t, stops, self.color_curve[:, channel])
+
+    def loop_behavior(self):
+        """Emit, move, bounce, collide and age all particles."""
+        for emitter in self.emitters:
+            emitter.emit(self)
+        if self.stepper is not None:
+            self.stepper.step(self)
+        else:
+            self.update_move(self.drag)
+            if self.bounds is not None:
+                self.update_in_box(*self.bounds)
+        if self.collider is not None:
+            self.collider.update(self)
+        self.update_lifetime()
+
+    def draw(self, surface):
+        """Draw all particles with the renderer.
+
+        :type surface: pygame.Surface
+        """
+        self.renderer.draw(self, surface)
+
+    def draw_interpolated(self, surface, alpha):
+        """Draw all particles with the renderer, between their previous and current position.
+
+        :type surface: pygame.Surface
+        :param alpha: fraction between previous and current position
+        :type alpha: float
+        """
+        self.renderer.draw(self, surface, alpha)
+
+    def __len__(self):
+        """Return amount of particles in use."""
+        return self.count
+
+    def __repr__(self):
+        """Return repr(self)."""
+        return represent("count capacity", self.count, self.capacity)
@@ -1,11 +1,25 @@
+from inspect import signature as _signature, Parameter as _Parameter
 from pygame import event as _event
 
+_POSITIONAL = (_Parameter.POSITIONAL_ONLY, _Parameter.POSITIONAL_OR_KEYWORD, _Parameter.VAR_POSITIONAL)
+
+
+def _accepts_event(func):
+    try:
+        return any(parameter.kind in _POSITIONAL for parameter in _signature(func).parameters.values())
+    except (TypeError, ValueError):
+        return False
+
 
 class Events:
     __all = list()
-    __functions = dict()
+    # Event type -> tuple of (priority, function, function takes the event), highest priority first.
+    __handlers = dict()
     __current = None
+    __stopped = False
+    __allowed = None
 
+    # The last dispatched event, which is kept after update, so it can still be read outside of the handlers.
     @staticmethod
     def get_current():
         return Events.__current
@@ -14,18 +28,58 @@ class Events:
     def update():
         Events.__all = _event.get()
         for event in Events.__all:
-            if event.type in Events.__functions:
-                Events.__current = event
-                Events.__functions[event.type]()
-        Events.__current = None
+            handlers = Events.__handlers.get(event.type)
+            if handlers is None:
+                continue
+            Events.__current = event
+            Events.__stopped = False
+            for _, func, takes_event in handlers:
+                if takes_event:
+                    func(event)
+                else:
+                    func()
+                if Events.__stopped:
+                    break
 
     @staticmethod
-    def set_new(func, event):
-        Events.__functions[event] = func
+    def stop_propagation():
+        Events.__stopped = True
 
     @staticmethod
-    def new(event):
+    def set_new(func, event, priority=0):
+        handlers = list(handler for handler in Events.__handlers.get(event, ()) if handler[1] != func)
+        handlers.append((priority, func, _accepts_event(func)))
+        Events.__handlers[event] = tuple(sorted(handlers, key=lambda handler: -handler[0]))
+        if Events.__allowed is not None:
+            Events.__allowed.add(event)
+            _event.set_allowed(event)
+
+    @staticmethod
+    def new(event, priority=0):
         def wrapper(func):
-            Events.__functions[event] = func
+            Events.set_new(func, event, priority)
             return func
         return wrapper
+
+    @staticmethod
+    def remove(func, event):
+        handlers = tuple(handler for handler in Events.__handlers.get(event, ()) if handler[1] != func)
+        if handlers:
+            Events.__handlers[event] = handlers
+        else:
+            Events.__handlers.pop(event, None)
+
+    @staticmethod
+    def get_handled():
+        return list(Events.__handlers)
+
+    @staticmethod
+    def set_allowed(*events):
+        Events.__allowed = set(events).union(Events.__handlers)
+        _event.set_blocked(None)
+        _event.set_allowed(list(Events.__allowed))
+
+    @staticmethod
+    def allow_all():
+        Events.__allowed = None
+        _event.set_allowed(None)
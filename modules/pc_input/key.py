@@ -3,6 +3,8 @@ from ..logic.constants import CharacterType as _CharacterType
 
 
 class Button:
+    __slots__ = ("_type", "_pressed", "_press_down", "_press_up", "_timer", "_last_pressed_time")
+
     def __init__(self, index):
         self._type = index
         self._pressed = False
@@ -57,6 +59,8 @@ class Button:
 
 
 class Key(Button):
+    __slots__ = ("_mod", "_unicode")
+
     def __init__(self, index, mod=0, unicode=""):
         Button.__init__(self, index)
         self._mod = mod
@@ -1,72 +1,97 @@
 from .key import Key as _Key
 from pygame import K_LSHIFT as _K_LSHIFT, K_RSHIFT as _K_RSHIFT
 
+# Key codes of keys without a character are their scancode (below 512) with this bit set.
+_SCANCODE_MASK = 1 << 30
+_KEY_BITS = 512
+
+
+# Key types below 512 and scancode key types each have a bit in the key bitsets. Other key types, characters of some
+# keyboard layouts, have no bit and give 0, these are looked up in active_keys instead.
+def _key_bit(key_type):
+    if key_type & _SCANCODE_MASK:
+        return 1 << (_KEY_BITS + (key_type ^ _SCANCODE_MASK))
+    if key_type < _KEY_BITS:
+        return 1 << key_type
+    return 0
+
 
 class _KeyboardObject:
     def __init__(self):
         self.last_key = None
-        self.active_keys = list()
+        self.active_keys = dict()
         self.writing_mode = True
 
-        self.__key_binds_down = list()
-        self.__key_binds_up = list()
-        self.__key_binds_pressed = list()
+        # Bitsets of the active keys and of the keys pressed down and up this frame, with one bit per key type.
+        self._active = 0
+        self._down = 0
+        self._up = 0
+        self._masks = dict()
 
-    @staticmethod
-    def _add_binds(key_list, func, keys):
-        keys = set(sorted(list(keys)))
-        for key_bind in key_list:
-            if key_bind[0] == keys:
-                key_list.remove(key_bind)
-                break
-        key_list.append((keys, func))
+        # Bindings are indexed by key type: combination -> function, per key that triggers the combination.
+        self.__key_binds_down = dict()
+        self.__key_binds_up = dict()
+        self.__key_binds_pressed = dict()
 
-    def _active_keys_types(self):
-        return list(key.get_type() for key in self.active_keys)
+    @staticmethod
+    def _add_binds(key_binds, func, keys, triggers=None):
+        keys = frozenset(keys)
+        for key in keys if triggers is None else triggers:
+            key_binds.setdefault(key, dict())[keys] = func
+
+    def _call_binds(self, key_binds, key_type):
+        active_keys = self.active_keys.keys()
+        for keys, func in list(key_binds.get(key_type, dict()).items()):
+            if active_keys >= keys:
+                func()
 
     def key_press_down(self, keypress):
         self.last_key = _Key(keypress.key, keypress.mod, keypress.unicode)
         self.last_key.set_press_down()
-        self.active_keys.append(self.last_key)
-
-        active_keys = set(key.get_type() for key in self.active_keys)
-        for combination in self.__key_binds_down:
-            keys, func = combination
-            if keys.issubset(active_keys):
-                func()
+        self.active_keys[keypress.key] = self.last_key
+        bit = _key_bit(keypress.key)
+        self._active |= bit
+        self._down |= bit
+        self._call_binds(self.__key_binds_down, keypress.key)
 
     def key_press_up(self, keypress):
-        for key in self.active_keys:
-            if key.get_type() == keypress.key:
-                key.set_press_up()
-                if self.writing_mode and key.get_type() in (_K_LSHIFT, _K_RSHIFT):
-                    self.reset_shift()
-
-        active_keys = set(key.get_type() for key in self.active_keys)
-        for combination in self.__key_binds_up:
-            keys, func = combination
-            if keys.issubset(active_keys):
-                func()
+        key = self.active_keys.get(keypress.key)
+        if key is not None:
+            self._set_press_up(key)
+            if self.writing_mode and key.get_type() in (_K_LSHIFT, _K_RSHIFT):
+                self.reset_shift()
+        self._call_binds(self.__key_binds_up, keypress.key)
+
+    def _set_press_up(self, key):
+        key.set_press_up()
+        self._up |= _key_bit(key.get_type())
+
+    def reset_keys(self):
+        for key in self.active_keys.values():
+            key.reset()
+        self._down = 0
+        self._up = 0
 
     def update_keys(self):
-        for key in self.active_keys:
+        for key in self.active_keys.values():
             key.update()
+        self._down = 0
+        self._up = 0
 
-        active_keys = set(key.get_type() for key in self.active_keys)
-        for combination in self.__key_binds_pressed:
-            keys, func = combination
-            if keys.issubset(active_keys):
-                func()
+        # Combinations held down are indexed by their lowest key only, so every combination is checked once.
+        for key_type in list(self.active_keys):
+            self._call_binds(self.__key_binds_pressed, key_type)
 
     def reset_shift(self):
-        for key in self.active_keys:
+        for key in self.active_keys.values():
             if key.get_mod() == 1 or key.get_mod() == 2:
-                key.set_press_up()
+                self._set_press_up(key)
 
     def reset_last_keys(self):
-        for key in self.active_keys:
+        for key_type, key in list(self.active_keys.items()):
             if not key.get_pressed():
-                self.active_keys.remove(key)
+                del self.active_keys[key_type]
+                self._active &= ~_key_bit(key_type)
                 if key == self.last_key:
                     self.last_key = None
 
@@ -81,28 +106,37 @@ class _KeyboardObject:
         Keyboard._add_binds(self.__key_binds_up, func, keys)
 
     def set_key_bind_pressed(self, func, *keys):
-        Keyboard._add_binds(self.__key_binds_pressed, func, keys)
+        Keyboard._add_binds(self.__key_binds_pressed, func, keys, (min(keys),))
+
+    def _get_mask(self, keys):
+        mask = self._masks.get(keys)
+        if mask is None:
+            bits = 0
+            for key_type in keys:
+                bits |= _key_bit(key_type)
+            mask = self._masks[keys] = (bits, tuple(key_type for key_type in keys if not _key_bit(key_type)))
+        return mask
 
     def get_key_pressed(self, *keys):
-        return all(key in self._active_keys_types() for key in keys)
+        bits, other_keys = self._get_mask(keys)
+        return self._active & bits == bits and all(key_type in self.active_keys for key_type in other_keys)
 
     def get_key_down(self, keypress):
-        for key in self.active_keys:
-            if keypress == key.get_type() and key.get_press_down():
-                return True
-        return False
+        bit = _key_bit(keypress)
+        if bit:
+            return bool(self._down & bit)
+        key = self.active_keys.get(keypress)
+        return key is not None and key.get_press_down()
 
     def get_key_up(self, keypress):
-        for key in self.active_keys:
-            if keypress == key.get_type() and key.get_press_up():
-                return True
-        return False
+        bit = _key_bit(keypress)
+        if bit:
+            return bool(self._up & bit)
+        key = self.active_keys.get(keypress)
+        return key is not None and key.get_press_up()
 
     def get_key(self, keypress):
-        for key in self.active_keys:
-            if key.get_type() == keypress:
-                return key
-        return None
+        return self.active_keys.get(keypress)
 
     def key_bind_down(self, *keys):
         def wrapper(func):
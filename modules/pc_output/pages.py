@@ -4,16 +4,99 @@ from ..pc_input.mouse import Mouse as _Mouse
 from ..pc_input.event import Events as _Events
 from ..pc_input.keyboard import Keyboard as _Keyboard
 from ..logic.constants import Default as _Default
-from ..logic.time import Time as _Time
+from ..logic.time import Time as _Time, CountDown as _CountDown
+from ..logic.loaders import AssetManifest as _AssetManifest
 from pygame import VIDEORESIZE as _VIDEORESIZE, QUIT as _QUIT, MOUSEBUTTONUP as _MOUSEBUTTONUP, MOUSEBUTTONDOWN as \
      _MOUSEBUTTONDOWN, KEYDOWN as _KEYDOWN, KEYUP as _KEYUP, init as _pygame_init, get_init as _pygame_get_init, \
      quit as _pygame_quit, K_F4 as _K_F4, K_LALT as _K_LALT, K_RALT as _K_RALT
 from pygame.time import Clock as _Clock
 
 
+class HitIndex:
+    # Buttons are sorted into a uniform grid of cells by their bounding box. The topmost button under the mouse, the
+    # one drawn last, is only looked up again when the mouse moved or the index changed. Every tick, only that button,
+    # the buttons it replaced and the buttons that changed state last tick are updated. The boxes of the buttons are
+    # compared with the boxes they were indexed with every tick, so buttons moved by effects are indexed again.
+    def __init__(self, cell_size=64):
+        self.cell_size = cell_size
+        self.buttons = list()
+        self.target = None
+        self.__cells = dict()
+        self.__boxes = list()
+        self.__dirty = True
+        self.__updated = list()
+
+    @staticmethod
+    def accepts(shape):
+        # Buttons that override loop_behavior keep updating themselves.
+        return getattr(shape, "hit_testable", False) and hasattr(shape, "hit_states") and \
+            getattr(type(shape), "loop_behavior", None) is getattr(type(shape), "hit_loop_behavior", None)
+
+    def __get_boxes(self):
+        return list((button.x, button.y, button.width, button.height) for button in self.buttons)
+
+    def set_buttons(self, buttons):
+        self.buttons = list(buttons)
+        self.__updated = list(button for button in self.__updated if button in self.buttons)
+        if self.target not in self.buttons:
+            self.target = None
+        self.invalidate()
+
+    def add(self, button):
+        self.buttons.append(button)
+        self.invalidate()
+
+    def clear(self):
+        self.buttons.clear()
+        self.target = None
+        self.__updated.clear()
+        self.invalidate()
+
+    def invalidate(self):
+        self.__dirty = True
+
+    def __build(self, boxes):
+        self.__cells.clear()
+        size = self.cell_size
+        for order, (button, (x, y, width, height)) in enumerate(zip(self.buttons, boxes)):
+            for column in range(int(x // size), int((x + width) // size) + 1):
+                for row in range(int(y // size), int((y + height) // size) + 1):
+                    self.__cells.setdefault((column, row), list()).append((order, button))
+        self.__boxes = boxes
+        self.__dirty = False
+
+    def pick(self, mouse_object=_Mouse):
+        if self.__dirty:
+            self.__build(self.__get_boxes())
+        cell = self.__cells.get((int(mouse_object.x // self.cell_size), int(mouse_object.y // self.cell_size)), ())
+        for _, button in reversed(cell):
+            if button.x <= mouse_object.x <= button.x + button.width and \
+                    button.y <= mouse_object.y <= button.y + button.height and button.collide_point(mouse_object):
+                return button
+        return None
+
+    def update(self, mouse_object=_Mouse):
+        boxes = self.__get_boxes()
+        if boxes != self.__boxes:
+            self.__build(boxes)
+            self.__dirty = True
+        if mouse_object.moving or self.__dirty:
+            self.target = self.pick(mouse_object)
+        updated = list(button for button in self.__updated if button.mouse_hover or button.mouse_click)
+        if self.target is not None and self.target not in updated:
+            updated.append(self.target)
+        for button in self.__updated:
+            if button not in updated:
+                button.hit_states(False, mouse_object)
+        for button in updated:
+            button.hit_states(button is self.target, mouse_object)
+        self.__updated = updated
+
+
 class _ShapeList:
-    def __init__(self, shapes):
+    def __init__(self, shapes, hit_index=None):
         self.__shapes = shapes
+        self.__hit_index = hit_index
         self.__loop_behavior_shapes = list()
         self.__update_alignment_shapes = list()
 
@@ -21,13 +104,20 @@ class _ShapeList:
         self.__reload_update_alignment_shapes()
 
     def __reload_loop_behavior_shapes(self):
-        self.__loop_behavior_shapes = list(shape for shape in self.__shapes if hasattr(shape, "loop_behavior"))
+        if self.__hit_index is None:
+            self.__loop_behavior_shapes = list(shape for shape in self.__shapes if hasattr(shape, "loop_behavior"))
+            return
+        self.__hit_index.set_buttons(shape for shape in self.__shapes if self.__hit_index.accepts(shape))
+        self.__loop_behavior_shapes = list(shape for shape in self.__shapes if hasattr(shape, "loop_behavior") and
+                                           not self.__hit_index.accepts(shape))
 
     def __reload_update_alignment_shapes(self):
         self.__update_alignment_shapes = list(shape for shape in self.__shapes if hasattr(shape, "update_alignment"))
 
     def __append_shape_update(self, shape):
-        if hasattr(shape, "loop_behavior"):
+        if self.__hit_index is not None and self.__hit_index.accepts(shape):
+            self.__hit_index.add(shape)
+        elif hasattr(shape, "loop_behavior"):
             self.__loop_behavior_shapes.append(shape)
         if hasattr(shape, "update_alignment"):
             self.__update_alignment_shapes.append(shape)
@@ -46,14 +136,16 @@ class _ShapeList:
         self.__shapes.clear()
         self.__loop_behavior_shapes.clear()
         self.__update_alignment_shapes.clear()
+        if self.__hit_index is not None:
+            self.__hit_index.clear()
 
     def count(self, shape):
         return self.__shapes.count(shape)
 
     def extend(self, shapes):
         self.__shapes.extend(shapes)
-        self.__loop_behavior_shapes.extend(shape for shape in shapes if hasattr(shape, "loop_behavior"))
-        self.__update_alignment_shapes.extend(shape for shape in shapes if hasattr(shape, "update_alignment"))
+        for shape in shapes:
+            self.__append_shape_update(shape)
 
     def index(self, shape):
         return self.__shapes.index(shape)
@@ -61,6 +153,8 @@ class _ShapeList:
     def insert(self, index, shape):
         self.__shapes.insert(index, shape)
         self.__append_shape_update(shape)
+        if self.__hit_index is not None and self.__hit_index.accepts(shape):
+            self.__reload_loop_behavior_shapes()
 
     def pop(self, index):
         self.__shapes.pop(index)
@@ -76,6 +170,8 @@ class _ShapeList:
         self.__shapes.reverse()
         self.__loop_behavior_shapes.reverse()
         self.__update_alignment_shapes.reverse()
+        if self.__hit_index is not None:
+            self.__reload_loop_behavior_shapes()
 
     def sort(self):
         pass
@@ -108,28 +204,67 @@ class _ShapeList:
 
 
 class Page:
-    def __init__(self, name, shapes, **variables):
+    def __init__(self, name, shapes, hit_index=False, **variables):
         self.name = name
-        self.shapes = _ShapeList(shapes)
+        self.hit_index = HitIndex() if hit_index else None
+        self.shapes = _ShapeList(shapes, self.hit_index)
         self.variables = variables
         self.running = False
         self.background_color = _Default.background_color
         self.timeline = _TimeLine()
+        self.manifest = _AssetManifest()
+        self.__previous = dict()
 
     def init(self):
         self.update_shapes_pos()
 
     def loop(self):
         while self.running:
-            _Display.fill(self.background_color)
-            for shape in self.shapes.get_loop_behavior_shapes():
-                shape.loop_behavior()
-            for shape in self.shapes:
-                shape.draw(_Display.surface)
-            self.loop_function()
-            self.timeline.update()
+            if Application.fixed_timestep:
+                for step in range(Application.get_steps()):
+                    self.step()
+                    if step == 0:
+                        Application.reset_input()
+                self.render(Application.alpha)
+            else:
+                _Display.fill(self.background_color)
+                self.update_hit_index()
+                for shape in self.shapes.get_loop_behavior_shapes():
+                    shape.loop_behavior()
+                for shape in self.shapes:
+                    shape.draw(_Display.surface)
+                self.loop_function()
+                self.timeline.update(Application.delta_time)
             Application.update()
 
+    def step(self):
+        # Positions before the step, which render blends with the positions after it for shapes moved by the step.
+        self.__previous = dict((id(shape), (shape.x, shape.y)) for shape in self.shapes
+                               if hasattr(shape, "set_pos") and not hasattr(shape, "draw_interpolated"))
+        self.update_hit_index()
+        for shape in self.shapes.get_loop_behavior_shapes():
+            shape.loop_behavior()
+        self.loop_function()
+        self.timeline.update()
+
+    def render(self, alpha=1):
+        # Shapes are drawn between their position before and after the last step, and are put back after drawing.
+        _Display.fill(self.background_color)
+        for shape in self.shapes:
+            if alpha == 1:
+                shape.draw(_Display.surface)
+            elif hasattr(shape, "draw_interpolated"):
+                shape.draw_interpolated(_Display.surface, alpha)
+            else:
+                previous = self.__previous.get(id(shape))
+                if previous is None or previous == (shape.x, shape.y):
+                    shape.draw(_Display.surface)
+                    continue
+                x, y = shape.x, shape.y
+                shape.set_pos(previous[0] + (x - previous[0]) * alpha, previous[1] + (y - previous[1]) * alpha)
+                shape.draw(_Display.surface)
+                shape.set_pos(x, y)
+
     def quit(self):
         pass
 
@@ -143,10 +278,25 @@ class Page:
         self.running = False
 
     def set_shapes(self, shapes):
-        self.shapes = _ShapeList(shapes)
+        if self.hit_index is not None:
+            self.hit_index.clear()
+        self.shapes = _ShapeList(shapes, self.hit_index)
+        self.__previous.clear()
+
+    def set_timeline(self, timeline):
+        self.timeline = timeline
+
+    def set_manifest(self, manifest):
+        self.manifest = manifest
+
+    def update_hit_index(self):
+        if self.hit_index is not None:
+            self.hit_index.update()
 
     def update_shapes_pos(self):
         _Display.update_shapes_pos(self.shapes.get_update_alignment_shapes())
+        if self.hit_index is not None:
+            self.hit_index.invalidate()
 
     def __getitem__(self, item):
         return self.variables[item]
@@ -160,6 +310,16 @@ class Application:
     clock = _Clock()
     ticks = _Default.ticks
 
+    fixed_timestep = False
+    max_steps = 5
+    frame_ticks = None
+    accumulator = 0
+    alpha = 1
+    steps = 0
+
+    time_based = False
+    delta_time = None
+
     @staticmethod
     def init(page_name, ticks=_Default.ticks):
         if not _pygame_get_init():
@@ -176,16 +336,66 @@ class Application:
         Application.ticks = ticks
         _Time.application_factor = ticks
 
+    @staticmethod
+    def set_fixed_timestep(fixed_timestep, max_steps=5, frame_ticks=None):
+        Application.fixed_timestep = fixed_timestep
+        Application.max_steps = max_steps
+        Application.frame_ticks = frame_ticks
+        Application.accumulator = 0
+        Application.alpha = 1
+        Application.steps = 0
+
+    @staticmethod
+    def set_time_based(time_based):
+        Application.time_based = time_based
+        Application.delta_time = None
+
+    @staticmethod
+    def get_steps():
+        # Amount of simulation steps to catch up with the elapsed time, capped at max_steps to prevent a spiral of
+        # death. The time left in the accumulator sets alpha, the interpolation factor for rendering.
+        step_time = 1000 / Application.ticks
+        Application.accumulator = min(Application.accumulator, Application.max_steps * step_time)
+        steps = int(Application.accumulator // step_time)
+        Application.accumulator -= steps * step_time
+        Application.alpha = Application.accumulator / step_time
+        Application.steps = steps
+        return steps
+
+    @staticmethod
+    def reset_input():
+        _Mouse.reset_buttons()
+        _Mouse.scroll = 0
+        _Keyboard.reset_keys()
+
     @staticmethod
     def set_page(page_name):
         Application.selected_name = page_name
         Application.update_page()
 
+    @staticmethod
+    def schedule_page(page_name, ticks):
+        Application.prefetch_page(page_name)
+        countdown = _CountDown(ticks, func=(Application.set_page, page_name))
+        Application.selected_page.timeline.append(countdown)
+        return countdown
+
+    @staticmethod
+    def prefetch_page(page_name):
+        page = Application.pages[page_name]
+        if hasattr(page, "manifest"):
+            page.manifest.prefetch()
+
     @staticmethod
     def update_page():
-        if hasattr(Application.selected_page, "stop"):
-            Application.selected_page.stop()
+        previous_page = Application.selected_page
+        if hasattr(previous_page, "stop"):
+            previous_page.stop()
         Application.selected_page = Application.pages[Application.selected_name]
+        if previous_page is not Application.selected_page and hasattr(previous_page, "manifest"):
+            previous_page.manifest.release(getattr(Application.selected_page, "manifest", None))
+        if hasattr(Application.selected_page, "manifest"):
+            Application.selected_page.manifest.prefetch()
         if hasattr(Application.selected_page, "start"):
             Application.selected_page.start()
 
@@ -210,11 +420,20 @@ class Application:
 
     @staticmethod
     def update():
-        _Mouse.update()
-        _Keyboard.update()
+        # A frame without simulation steps keeps the input of this frame, presses and releases are then read by the
+        # first step of a later frame instead of being cleared before any step saw them.
+        if not Application.fixed_timestep or Application.steps > 0:
+            _Mouse.update()
+            _Keyboard.update()
         _Display.flip()
         _Events.update()
-        Application.clock.tick(Application.ticks)
+        if Application.fixed_timestep:
+            frame_ticks = Application.ticks if Application.frame_ticks is None else Application.frame_ticks
+            Application.accumulator += Application.clock.tick(frame_ticks)
+        elif Application.time_based:
+            Application.delta_time = Application.clock.tick(Application.ticks) / 1000
+        else:
+            Application.clock.tick(Application.ticks)
 
     @staticmethod
     def loop():
@@ -226,8 +445,7 @@ class Application:
 
     @staticmethod
     @_Events.new(_VIDEORESIZE)
-    def update_screen():
-        event = _Events.get_current()
+    def update_screen(event):
         _Display.set_size(event.w, event.h)
         if hasattr(Application.selected_page, "update_shapes_pos"):
             Application.selected_page.update_shapes_pos()
@@ -243,22 +461,20 @@ class Application:
 
     @staticmethod
     @_Events.new(_MOUSEBUTTONDOWN)
-    def update_mouse_button_down():
-        button = _Events.get_current().button
-        _Mouse.update_button_down(button)
+    def update_mouse_button_down(event):
+        _Mouse.update_button_down(event.button)
 
     @staticmethod
     @_Events.new(_MOUSEBUTTONUP)
-    def update_mouse_button_up():
-        button = _Events.get_current().button
-        _Mouse.update_button_up(button)
+    def update_mouse_button_up(event):
+        _Mouse.update_button_up(event.button)
 
     @staticmethod
     @_Events.new(_KEYDOWN)
-    def update_keyboard_down():
-        _Keyboard.key_press_down(_Events.get_current())
+    def update_keyboard_down(event):
+        _Keyboard.key_press_down(event)
 
     @staticmethod
     @_Events.new(_KEYUP)
-    def update_keyboard_up():
-        _Keyboard.key_press_up(_Events.get_current())
+    def update_keyboard_up(event):
+        _Keyboard.key_press_up(event)
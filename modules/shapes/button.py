@@ -11,7 +11,14 @@ from collections.abc import Sequence as _Sequence
 
 
 class AbstractButton:
-    """A class to contain the abstract functionality of a button without a visual implementation."""
+    """A class to contain the abstract functionality of a button without a visual implementation.
+
+    Buttons that are hit_testable can be updated by the HitIndex of a page, which only updates the buttons the mouse
+    enters, leaves or is on, instead of letting every button test the mouse itself every tick. Buttons that override
+    loop_behavior are left out of the index and keep updating themselves.
+    """
+
+    hit_testable = True
 
     def __init__(self, press_up_function, press_down_function, pressed_function, hover_function):
         """Initiate AbstractButton object.
@@ -76,10 +83,23 @@ class AbstractButton:
         :return: if there is a state change
         :rtype: bool
         """
+        return self.hit_states(self.collide_point(mouse_object), mouse_object, mouse_button_type)
+
+    def hit_states(self, hit, mouse_object=_Mouse, mouse_button_type=_MouseButtonType.left):
+        """Update the state_change attribute according to a known collision with the point and the mouse button states.
 
+        Same as mouse_states, with the collision of the point already tested, by mouse_states or by a HitIndex.
+
+        :param hit: the point is within the defined area of the button
+        :type hit: bool
+        :type mouse_object: _MouseObject
+        :type mouse_button_type: int
+        :return: if there is a state change
+        :rtype: bool
+        """
         mouse_button = mouse_object.get_button(mouse_button_type)
         self.state_change = _ButtonState.none
-        if self.collide_point(mouse_object):
+        if hit:
             self.hover_function.execute()
             if not self.mouse_hover:
                 self.mouse_hover = True
@@ -106,6 +126,9 @@ class AbstractButton:
         """Code behavior of the shapes during the loop of the application."""
         return self.mouse_states()
 
+    # The loop_behavior a HitIndex replaces, it only takes over buttons that don't override it.
+    hit_loop_behavior = loop_behavior
+
 
 class SurfaceButton(AbstractButton, _SurfaceRect):
     """A class to represent a rectangular button with a two-dimensional color-array in two-dimensional space."""
@@ -14,6 +14,9 @@ from math import inf as _inf
 class AbstractSlider(_AbstractButton):
     """A class to contain the abstract functionality of a slider without a visual implementation."""
 
+    # Sliders keep testing the mouse themselves, they are dragged while the mouse is outside of them.
+    hit_testable = False
+
     def __init__(self, val_range, default_value, rounding, value_change_function):
         """Initiate AbstractSlider object, inheriting from AbstractButton class.
 